@@ -1,6 +1,15 @@
+import base64
+import calendar
+import functools
+from collections import deque
 import io
 import re
+import shutil
 import subprocess
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import zipfile
 import os
 import sys
@@ -8,12 +17,14 @@ import struct
 import html
 import json
 import logging
+import mmap
 import traceback
 from datetime import datetime, timedelta
 
 # Filter PyQt5 warning messages (ignore QTableWidget sorting-related warnings)
 os.environ['QT_LOGGING_RULES'] = '*.debug=false;qt.qobject.connect.warning=false;qt.qobject.connect=false'
 
+import numpy as np
 import pandas as pd
 from pyaxmlparser import APK
 from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
@@ -22,12 +33,363 @@ from PyQt5.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout,
                              QGroupBox, QLineEdit, QMessageBox, QProgressBar,
                              QTabWidget, QTableWidget, QTableWidgetItem, QHeaderView,
                              QDialog, QInputDialog, QTreeWidget, QTreeWidgetItem,
-                             QSplitter, QComboBox, QSizePolicy, QMenu)
-from PyQt5.QtCore import Qt, QThread, pyqtSignal, qInstallMessageHandler
+                             QSplitter, QComboBox, QSizePolicy, QMenu, QTableView)
+from PyQt5.QtCore import (Qt, QThread, QSignalBlocker, pyqtSignal, qInstallMessageHandler,
+                          QAbstractTableModel, QModelIndex, QSortFilterProxyModel)
 from PyQt5.QtGui import QTextDocument, QTextCursor, QClipboard
 
 # sqlite3 is lazy imported (prevent DLL issues)
 
+# 대용량 로그 전체를 스캔하는 패턴은 가능하면 google-re2(선형 시간 엔진) 사용
+# (선택적 의존성 - 없으면 표준 re로 동작)
+try:
+    import re2 as _re_engine
+except ImportError:
+    _re_engine = re
+
+# ccl_abx가 모듈로 존재하면 서브프로세스 대신 프로세스 내에서 직접 호출
+try:
+    import ccl_abx as _ccl_abx
+except ImportError:
+    _ccl_abx = None
+
+# 저장 결과 JSON 입출력 가속 (선택적 의존성 - 없으면 표준 json으로 동작)
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+
+def _json_load_file(filepath):
+    """저장 결과 JSON 파일 로드 (orjson이 있으면 사용)"""
+    if _orjson is not None:
+        with open(filepath, 'rb') as f:
+            return _orjson.loads(f.read())
+    with open(filepath, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _json_dump_file(filepath, data, convert=None):
+    """저장 결과 JSON 파일 기록 (orjson이 있으면 사용)
+
+    orjson은 datetime을 네이티브로 직렬화하므로 변환 없이 바로 쓰고,
+    표준 json 폴백에서만 convert(직렬화 가능 형태로의 변환 함수)를 적용한다.
+    들여쓰기 2칸 형식은 두 경로 모두 동일하게 유지.
+    """
+    if _orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(_orjson.dumps(
+                data, default=str,
+                option=_orjson.OPT_INDENT_2 | _orjson.OPT_NON_STR_KEYS))
+        return
+    if convert is not None:
+        data = convert(data)
+    with open(filepath, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def _size_columns_from_sample(table, sample=50):
+    """앞쪽 sample행만 측정해 열 너비 설정
+
+    resizeColumnsToContents는 모든 행의 텍스트 폭을 측정하므로 행이
+    많은 테이블에서는 채우기보다 비싸진다. 결과 테이블은 열별 값 형태가
+    균일하므로(경로/시간 문자열) 앞쪽 표본만으로 충분하다. 헤더 폭은
+    항상 포함한다. 마지막 열은 기존 setStretchLastSection이 처리.
+    """
+    model = table.model()
+    if model is None:
+        return
+    fm = table.fontMetrics()
+    rows = min(model.rowCount(), sample)
+    for col in range(model.columnCount()):
+        width = fm.horizontalAdvance(str(model.headerData(col, Qt.Horizontal) or ""))
+        for row in range(rows):
+            value = model.index(row, col).data()
+            if value is not None:
+                w = fm.horizontalAdvance(str(value))
+                if w > width:
+                    width = w
+        table.setColumnWidth(col, width + 20)
+
+# 파서에서 반복 사용하는 패턴은 모듈 레벨에서 한 번만 컴파일
+_RECOVERY_START_RE = _re_engine.compile(
+    r'(?:I:)?Starting recovery\s*\(pid\s+\d+\)\s+on\s+'
+    r'([A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4})'
+)
+# recovery/last_log 타임라인용 라인 패턴
+_GST_LINE_RE = _re_engine.compile(r'get_system_time=(\d{4}-\d{2}-\d{2})-(\d{2}:\d{2}:\d{2})')
+_GST_REL_LINE_RE = _re_engine.compile(
+    r'\[\s*(\d+\.\d+)\]\s+.*get_system_time=(\d{4}-\d{2}-\d{2})-(\d{2}:\d{2}:\d{2})'
+)
+_REL_LINE_RE = _re_engine.compile(r'\[\s*(\d+\.\d+)\]\s+(.*)$')
+# 전체 문자열을 한 번에 스캔하는 MULTILINE 버전 (splitlines 리스트 생성 방지)
+_REL_LINE_ML_RE = _re_engine.compile(r'(?m)^\[\s*(\d+\.\d+)\]\s+(.*)$')
+# Xiaomi 타임라인에서 초기화 관련 이벤트를 한 번의 스캔으로 걸러내는 패턴
+_WIPE_EVENT_RE = _re_engine.compile(r'-- Wiping data|Data wipe complete|Formatting /data|Info: format successful')
+_WIPE_EVENT_NAMES = {
+    "-- Wiping data": "초기화 시작",
+    "Data wipe complete": "초기화 완료",
+    "Formatting /data": "포맷팅",
+    "Info: format successful": "포맷팅",
+}
+# 초기화 관련 이벤트 패턴 (라인 메시지 대상)
+_WIPE_KEYWORD_PATTERNS = (
+    (_re_engine.compile(r'(?i)--\s*Wiping\s+data'), "초기화 시작"),
+    (_re_engine.compile(r'(?i)Data\s+wipe\s+complete'), "초기화 완료"),
+    (_re_engine.compile(r'(?i)Formatting\s+/data'), "데이터 포맷팅 시작"),
+    (_re_engine.compile(r'(?i)Info:\s*format\s+successful'), "포맷 완료"),
+)
+_SUGGESTIONS_RE = _re_engine.compile(
+    r'<long name="com\.android\.settings\.suggested\.category\.DEFERRED_SETUP_setup_time"\s+value="(\d+)"'
+)
+_ULR_RE = _re_engine.compile(r'<long name="reportingAutoenableManagerInitTimeMillisKey"\s+value="(\d+)"')
+# ASCII 전용 패턴은 바이트 버전도 준비 (전체 파일 디코딩 생략용)
+_ULR_RE_B = _re_engine.compile(rb'<long name="reportingAutoenableManagerInitTimeMillisKey"\s+value="(\d+)"')
+# persistent_properties: reboot,factory_reset 뒤에 쉼표/공백/개행/콜론/등호가 오는
+# 경우를 모두 포괄하는 단일 패턴 (쉼표 연결형은 부분집합)
+_PERSISTENT_RE_FULL = _re_engine.compile(r"(?ms)reboot,factory_reset[,\s:=]+(\d{10,})")
+# eRR.p의 RST_STAT 라인 패턴 (str/bytes 양쪽)
+_RST_STAT_RE = _re_engine.compile(r"(?i)(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\+?(\d{4})?.*?RST_STAT")
+_RST_STAT_RE_B = _re_engine.compile(rb"(?i)(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\+?(\d{4})?.*?RST_STAT")
+# ccl_abx.py 출력(appops)에서 setupwizard 타임스탬프 추출 패턴
+_ABX_PIXEL_RE = re.compile(
+    r'<pkg[^>]*n="com\.google\.android\.(?:pixel\.)?setupwizard"[^>]*>.*?<st[^>]*\br="(\d+)"',
+    re.DOTALL | re.IGNORECASE,
+)
+_ABX_GALAXY_RE = re.compile(
+    r'<pkg[^>]*n="com\.sec\.android\.app\.?SecSetupWizard"[^>]*>.*?<st[^>]*\br="(\d+)"',
+    re.DOTALL | re.IGNORECASE,
+)
+_R_ATTR_RE = re.compile(r'\br="(\d+)"')
+# Xiaomi 타임라인에서 관심 키워드를 한 번의 C 레벨 검색으로 거르는 패턴
+_XIAOMI_KEYWORD_RE = _re_engine.compile(
+    r'get_system_time=|-- Wiping data|Formatting /data|Info: format successful'
+    r'|Data wipe complete|Saving new_status|enter finish_recovery'
+)
+
+# KST(UTC+9) 변환에 반복 사용하는 오프셋
+_KST_OFFSET = timedelta(hours=9)
+# epoch 계산용 기준 시각 (utctimetuple()+timegm 대신 timedelta 뺄셈으로 직접 계산)
+_EPOCH = datetime(1970, 1, 1)
+
+# wellbeing 이벤트 타입 -> 이름 매핑 (SQL CASE 식 대신 파이썬 dict 조회)
+_PIXEL_EVENT_NAMES = {
+    1: 'ACTIVITY_RESUMED',
+    2: 'ACTIVITY_PAUSED',
+    12: 'NOTIFICATION',
+    18: 'KEYGUARD_HIDDEN || DEVICE UNLOCK',
+    19: 'FOREGROUND_SERVICE START',
+    20: 'FOREGROUND_SERVICE_STOP',
+    23: 'ACTIVITY_STOPPED',
+    26: 'DEVICE_SHUTDOWN',
+    27: 'DEVICE_STARTUP',
+}
+_GALAXY_EVENT_NAMES = {
+    1: 'ACTIVITY_RESUMED',
+    2: 'ACTIVITY_PAUSED',
+    5: 'CONFIGURATION_CHANGE',
+    7: 'USER_INTERACTION',
+    10: 'NOTIFICATION PANEL',
+    11: 'STANDBY_BUCKET_CHANGED',
+    12: 'NOTIFICATION',
+    15: 'SCREEN_INTERACTIVE (Screen on for full user interaction)',
+    16: 'SCREEN_NON_INTERACTIVE (Screen on in Non-interactive state or completely turned off)',
+    17: 'KEYGUARD_SHOWN || POSSIBLE DEVICE LOCK',
+    18: 'KEYGUARD_HIDDEN || DEVICE UNLOCK',
+    19: 'FOREGROUND_SERVICE START',
+    20: 'FOREGROUND_SERVICE_STOP',
+    23: 'ACTIVITY_STOPPED',
+    26: 'DEVICE_SHUTDOWN',
+    27: 'DEVICE_STARTUP',
+}
+
+# wellbeing 조회 쿼리 (ZIP/ADB 경로 공용)
+# 타임스탬프는 원시 epoch(ms)로 가져와 파이썬에서 일괄 변환한다
+# (SQLite datetime()의 행 단위 문자열 포맷 비용 제거)
+_WELLBING_QUERY_PIXEL = """
+    SELECT events._id,
+           events.timestamp as timestamps,
+           packages.package_name, events.type
+    FROM events
+    INNER JOIN packages ON events.package_id=packages._id
+    WHERE packages.package_name IN ('com.google.android.setupwizard', 'android')
+    ORDER by timestamps
+"""
+_WELLBING_QUERY_GALAXY = """
+    SELECT usageEvents.eventId,
+           usageEvents.timeStamp as timestamp,
+           foundPackages.name, usageEvents.eventType
+    FROM usageEvents
+    INNER JOIN foundPackages ON usageEvents.pkgId=foundPackages.pkgId
+    WHERE foundPackages.name IN ('setupwizard', 'android')
+    ORDER BY timestamp
+"""
+
+_np_epoch_s = np.datetime64('1970-01-01', 's')
+
+
+def _fast_iso(s):
+    """'YYYY-MM-DD HH:MM:SS' 고정폭 문자열 전용 고속 파서
+
+    strptime은 포맷 해석 비용이 커서 반복 호출 시 병목이 된다.
+    형식이 어긋나면 ValueError를 던지므로 호출부에서 strptime으로 폴백한다.
+    """
+    return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]),
+                    int(s[11:13]), int(s[14:16]), int(s[17:19]))
+
+
+# 저장/표시 경로에서 같은 ISO 문자열이 반복 파싱되므로 결과를 메모이즈
+_parse_iso = functools.lru_cache(maxsize=65536)(datetime.fromisoformat)
+
+# 저장 파일명 첫 토큰의 차수 패턴 ("N차" 또는 "ExN")
+_ORDER_RE = _re_engine.compile(r"차|^Ex\d+$")
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_saved_filename(display_name):
+    """저장 파일명에서 (차수, 제조사, 모델명, 시나리오) 추출
+
+    트리 재구성·표시 갱신 때마다 같은 파일명을 반복 파싱하므로 메모이즈한다.
+    차수 토큰이 없으면 차수는 빈 문자열로 두고 나머지를 그대로 해석한다.
+    """
+    parts = display_name.split()
+    order = ''
+    remaining = parts
+    if parts and _ORDER_RE.search(parts[0]):
+        order = parts[0]
+        remaining = parts[1:]
+    manufacturer = ''
+    model = ''
+    scenario = ''
+    if len(remaining) >= 3:
+        manufacturer = remaining[0]
+        model = remaining[1]
+        scenario = ' '.join(remaining[2:])
+    elif len(remaining) == 2:
+        manufacturer = remaining[0]
+        model = remaining[1]
+    elif len(remaining) == 1:
+        model = remaining[0]
+    return order, manufacturer, model, scenario
+
+
+def _intern_str(value):
+    """str이면 intern해 중복 사본을 공유 (str이 아니면 그대로 반환)
+
+    결과 JSON에는 같은 아티팩트 이름·경로·포맷 문자열이 행마다 별도
+    객체로 파싱되어 들어오므로, 테이블 행으로 올리기 전에 공유시킨다.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _detect_encoding(raw):
+    """BOM과 4KB 프리픽스 검사로 인코딩 추정
+
+    인코딩 후보를 차례로 전체 디코딩해 보는 대신, BOM을 먼저 확인하고
+    앞부분 4KB만 utf-8로 시험 디코딩한다 (실패 시 cp949로 간주).
+    """
+    if raw.startswith(b'\xff\xfe'):
+        return 'utf-16le'
+    if raw.startswith(b'\xfe\xff'):
+        return 'utf-16be'
+    if raw.startswith(b'\xef\xbb\xbf'):
+        return 'utf-8-sig'
+    try:
+        raw[:4096].decode('utf-8')
+        return 'utf-8'
+    except UnicodeDecodeError as e:
+        # 4KB 경계에서 멀티바이트 문자가 잘린 경우는 utf-8로 취급
+        if e.start >= 4093:
+            return 'utf-8'
+        return 'cp949'
+
+
+def _apply_wellbing_event_names(df):
+    """wellbeing 조회 결과 후처리
+
+    - epoch(ms) 타임스탬프 컬럼을 numpy로 일괄 변환해 기존
+      'YYYY-MM-DD HH:MM:SS' 문자열 형식 유지
+    - 이벤트 타입 번호를 이름 컬럼으로 변환 (SQLite CASE보다 dict 조회가 빠름)
+    """
+    if df is None:
+        return df
+    for ts_col in ("timestamps", "timestamp"):
+        if ts_col in df.columns and len(df):
+            try:
+                arr = df[ts_col].to_numpy(dtype='i8')
+                iso = (_np_epoch_s + (arr // 1000).astype('timedelta64[s]')).astype(str)
+                df[ts_col] = np.char.replace(iso, 'T', ' ')
+            except (TypeError, ValueError):
+                pass  # 이미 문자열이거나 혼합 타입이면 그대로 둔다
+            break
+    if "type" in df.columns:
+        df["eventtype"] = [_PIXEL_EVENT_NAMES.get(t, t) for t in df["type"]]
+    elif "eventType" in df.columns:
+        df["eventTypeDescription"] = [_GALAXY_EVENT_NAMES.get(t, t) for t in df["eventType"]]
+    return df
+
+
+# "아직 결정 전"을 None(탐색 실패)과 구분하기 위한 센티널
+_UNSET = object()
+
+# Deep Search: 날짜-only 매칭 주변에 시각이 붙어 있는지 확인용
+_HMS_RE = _re_engine.compile(r"\d{2}:\d{2}:\d{2}")
+
+# 사용자 ID 추출용 경로 접두 패턴 (split('/') 리스트 할당 없이 매칭)
+_USER_PREFIX_RE = _re_engine.compile(r"^(?:Dump/)?data/user/([^/]+)")
+
+# Deep Search에서 건너뛸 바이너리/미디어 확장자
+_DEEP_SEARCH_SKIP_EXTS = ('.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mp3',
+                          '.apk', '.so', '.dex', '.bin', '.dat', '.zip', '.rar')
+
+# Deep Search: 이 크기를 넘는 파일은 전체 버퍼 대신 겹침 청크로 스캔
+_SCAN_CHUNK = 1 << 20  # 1MB
+_LARGE_SCAN_THRESHOLD = 8 << 20  # 8MB
+# mtime이 오차 범위 밖이어도 이 크기 이하 파일은 내용 스캔 유지
+_MTIME_SKIP_MIN_SIZE = 256 << 10  # 256KB
+# 이 크기를 넘는 파일은 후보에서 제외 (타임스탬프 로그가 아닌 거대 바이너리)
+_DEEP_SEARCH_MAX_SIZE = 512 << 20  # 512MB
+
+
+def _build_binary_patterns(time_dt):
+    """시간 값을 바이너리 패턴으로 변환 (Deep Search HEX 매칭용)"""
+    patterns = {}
+    epoch_sec = int(time_dt.timestamp())
+    epoch_ms = int(time_dt.timestamp() * 1000)
+
+    # 32-bit/64-bit seconds
+    patterns["epoch_sec_le32"] = struct.pack("<I", epoch_sec & 0xFFFFFFFF)
+    patterns["epoch_sec_be32"] = struct.pack(">I", epoch_sec & 0xFFFFFFFF)
+    patterns["epoch_sec_le64"] = struct.pack("<Q", epoch_sec)
+    patterns["epoch_sec_be64"] = struct.pack(">Q", epoch_sec)
+
+    # 64-bit milliseconds
+    patterns["epoch_ms_le64"] = struct.pack("<Q", epoch_ms)
+    patterns["epoch_ms_be64"] = struct.pack(">Q", epoch_ms)
+
+    return patterns
+
+
+def _tune_sqlite(conn):
+    """읽기 전용 임시 DB 조회용 PRAGMA 일괄 적용 (내구성 불필요 → 속도 우선)"""
+    try:
+        conn.executescript(
+            "PRAGMA journal_mode=OFF;"
+            "PRAGMA synchronous=OFF;"
+            "PRAGMA cache_size=-65536;"
+            "PRAGMA temp_store=MEMORY;"
+            "PRAGMA mmap_size=268435456;"
+        )
+    except Exception:
+        pass  # 구버전 SQLite에서 일부 PRAGMA 미지원이어도 조회는 계속
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_recovery_ts(time_str):
+    """recovery/last_log의 'Sat Jan 01 00:00:00 2024' 형식 파싱 (동일 문자열 반복 파싱 캐시)"""
+    dt = datetime.strptime(time_str, "%a %b %d %H:%M:%S %Y")
+    return dt, calendar.timegm(dt.utctimetuple())
+
 
 class CopyableMessageBox(QDialog):
     """Message box with copyable text"""
@@ -117,8 +479,17 @@ class DeepSearchThread(QThread):
 
 
 class FactoryResetGUI(QMainWindow):
+    # 워커 스레드에서 온 아티팩트 데이터를 메인 스레드로 전달하는 시그널
+    artifact_data_received = pyqtSignal(str, str, str, object, object, bool, object)
+    artifact_batch_received = pyqtSignal(str, list)
+    # 워커 스레드의 로그 메시지도 메인 스레드에서만 QTextEdit에 추가
+    log_received = pyqtSignal(str)
+
     def __init__(self):
         super().__init__()
+        self.artifact_data_received.connect(self.add_artifact_data)
+        self.artifact_batch_received.connect(self.add_artifact_data_batch)
+        self.log_received.connect(self.log)
         self.reset_instance = None
         self.artifact_data = {}  # Store data for each artifact
         self.use_kst = True  # Default is KST
@@ -970,8 +1341,8 @@ class FactoryResetGUI(QMainWindow):
                     # recovery.log 등은 UTC로 기록되는 경우가 있어 ±9시간 허용
                     diffs = [
                         abs((time_dt - target_dt).total_seconds()),
-                        abs((time_dt + timedelta(hours=9) - target_dt).total_seconds()),
-                        abs((time_dt - timedelta(hours=9) - target_dt).total_seconds()),
+                        abs((time_dt + _KST_OFFSET - target_dt).total_seconds()),
+                        abs((time_dt - _KST_OFFSET - target_dt).total_seconds()),
                     ]
                     match = min(diffs) <= 60
                     if is_recovery_row:
@@ -1171,9 +1542,11 @@ class FactoryResetGUI(QMainWindow):
             if item_key not in hidden_items:
                 visible_data_list.append(data)
         
+        # 행을 하나씩 insertRow 하면 매번 지오메트리 재계산이 발생하므로
+        # 필요한 개수를 한 번에 확보 (상태 행만 있는 경우는 건드리지 않음)
+        if visible_data_list:
+            table.setRowCount(len(visible_data_list))
         for row, data in enumerate(visible_data_list):
-            table.insertRow(row)
-            
             # Create item key for this row
             item_key = self._get_item_key(data)
             hidden_items = self.hidden_items.get(artifact_id, set())
@@ -1206,12 +1579,12 @@ class FactoryResetGUI(QMainWindow):
                             time_str = time_value.strftime('%Y-%m-%d %H:%M:%S KST')
                         else:
                             # Subtract 9 hours to display as UTC
-                            display_time = time_value - timedelta(hours=9)
+                            display_time = time_value - _KST_OFFSET
                             time_str = display_time.strftime('%Y-%m-%d %H:%M:%S UTC')
                     else:
                         # UTC인 경우
                         if self.use_kst:
-                            display_time = time_value + timedelta(hours=9)
+                            display_time = time_value + _KST_OFFSET
                             time_str = display_time.strftime('%Y-%m-%d %H:%M:%S KST')
                         else:
                             display_time = time_value
@@ -1237,7 +1610,7 @@ class FactoryResetGUI(QMainWindow):
             item_original = QTableWidgetItem(original_time_str)
             table.setItem(row, 4, item_original)
         
-        table.resizeColumnsToContents()
+        _size_columns_from_sample(table)
         # Each artifact table is highlighted based on that artifact's time data
         self.highlight_artifact_table(artifact_id, table, data_list)
     
@@ -1293,8 +1666,8 @@ class FactoryResetGUI(QMainWindow):
                 # Allow ±9 hours considering UTC/KST difference
                 diffs = [
                     abs((row_time_dt - extracted_dt).total_seconds()),
-                    abs((row_time_dt + timedelta(hours=9) - extracted_dt).total_seconds()),
-                    abs((row_time_dt - timedelta(hours=9) - extracted_dt).total_seconds()),
+                    abs((row_time_dt + _KST_OFFSET - extracted_dt).total_seconds()),
+                    abs((row_time_dt - _KST_OFFSET - extracted_dt).total_seconds()),
                 ]
                 if min(diffs) <= 60:  # Difference within 1 minute
                     match = True
@@ -1348,12 +1721,12 @@ class FactoryResetGUI(QMainWindow):
                             display_time = time_value
                             time_str = display_time.strftime('%Y-%m-%d %H:%M:%S KST')
                         else:
-                            display_time = time_value - timedelta(hours=9)
+                            display_time = time_value - _KST_OFFSET
                             time_str = display_time.strftime('%Y-%m-%d %H:%M:%S UTC')
                     else:
                         # If UTC
                         if self.use_kst:
-                            display_time = time_value + timedelta(hours=9)
+                            display_time = time_value + _KST_OFFSET
                             time_str = display_time.strftime('%Y-%m-%d %H:%M:%S KST')
                         else:
                             display_time = time_value
@@ -1380,11 +1753,14 @@ class FactoryResetGUI(QMainWindow):
         
         # Sort by time
         all_time_data.sort(key=lambda x: x['time'])
-        
-        # Add to table
+
+        # Add to table (행 개수를 한 번에 확보하고, 채우는 동안 헤더 정렬이
+        # 행마다 재정렬하지 않도록 잠시 꺼 둔다)
+        sorting = self.summary_table.isSortingEnabled()
+        self.summary_table.setSortingEnabled(False)
+        self.summary_table.setRowCount(len(all_time_data))
         for row, data in enumerate(all_time_data):
-            self.summary_table.insertRow(row)
-            
+
             # Artifact name
             item_artifact = QTableWidgetItem(data['artifact_name'])
             self.summary_table.setItem(row, 0, item_artifact)
@@ -1406,8 +1782,9 @@ class FactoryResetGUI(QMainWindow):
             # Original time
             item_original = QTableWidgetItem(data['original_time_str'])
             self.summary_table.setItem(row, 4, item_original)
-        
-        self.summary_table.resizeColumnsToContents()
+
+        self.summary_table.setSortingEnabled(sorting)
+        _size_columns_from_sample(self.summary_table)
         self.apply_confirmed_time_highlight()
         
         # Sort by time column (ascending order)
@@ -1515,6 +1892,11 @@ class FactoryResetGUI(QMainWindow):
             is_kst: 이미 KST 시간인지 여부 (True면 UTC 변환 안 함)
             original_time: 원본 시간 데이터 (정규화 전)
         """
+        # 워커 스레드에서 호출되면 시그널로 메인 스레드에 위임 (Qt 위젯은 메인 스레드 전용)
+        if QThread.currentThread() is not self.thread():
+            self.artifact_data_received.emit(artifact_id, name, path, time_value, message, bool(is_kst), original_time)
+            return
+
         if artifact_id not in self.artifact_data:
             self.artifact_data[artifact_id] = []
         
@@ -1533,6 +1915,25 @@ class FactoryResetGUI(QMainWindow):
         # 종합 결과 탭 업데이트
         self.update_summary_table()
     
+    def add_artifact_data_batch(self, artifact_id, records):
+        """아티팩트 데이터 일괄 추가
+
+        수천 행짜리 결과를 행마다 add_artifact_data로 넣으면 행 수만큼
+        표/종합 탭이 다시 그려지므로, 레코드 목록을 모아 받아 갱신을
+        한 번만 수행한다. records의 각 항목은 artifact_data와 동일한
+        dict 형태(name/path/time/message/is_kst/original_time)다.
+        """
+        if not records:
+            return
+        # 워커 스레드에서 호출되면 시그널로 메인 스레드에 위임
+        if QThread.currentThread() is not self.thread():
+            self.artifact_batch_received.emit(artifact_id, records)
+            return
+
+        self.artifact_data.setdefault(artifact_id, []).extend(records)
+        self.update_table(artifact_id, self.artifact_data[artifact_id])
+        self.update_summary_table()
+
     def clear_artifact_data(self, artifact_id):
         """아티팩트 데이터 초기화"""
         if artifact_id in self.artifact_data:
@@ -1641,7 +2042,7 @@ class FactoryResetGUI(QMainWindow):
                     is_kst = data.get('is_kst', False)
                     # UTC로 변환 (검색용)
                     if is_kst:
-                        utc_time = time_value - timedelta(hours=9)
+                        utc_time = time_value - _KST_OFFSET
                     else:
                         utc_time = time_value
                     search_times.append({
@@ -1693,7 +2094,7 @@ class FactoryResetGUI(QMainWindow):
         match_item.setData(Qt.UserRole, raw_match_value)
         self.deep_search_table.setItem(row, 3, match_item)
         
-        self.deep_search_table.resizeColumnsToContents()
+        _size_columns_from_sample(self.deep_search_table)
 
     def show_deep_search_detail(self, row, column):
         """View deep search result details"""
@@ -2254,10 +2655,11 @@ class FactoryResetGUI(QMainWindow):
                 
                 with zipfile.ZipFile(self.saved_file_path, 'r') as zf:
                     zip_file_list = zf.namelist()
-                    
+                    zip_name_set = set(zip_file_list)  # 후보별 선형 스캔 대신 O(1) 조회
+
                     for zip_path in path_candidates:
                         # 정확한 매칭 시도
-                        if zip_path in zip_file_list:
+                        if zip_path in zip_name_set:
                             try:
                                 with zf.open(zip_path) as f:
                                     raw_bytes = f.read()
@@ -2458,21 +2860,7 @@ class FactoryResetGUI(QMainWindow):
 
     def build_binary_patterns(self, time_dt):
         """시간 값을 바이너리 패턴으로 변환"""
-        patterns = {}
-        epoch_sec = int(time_dt.timestamp())
-        epoch_ms = int(time_dt.timestamp() * 1000)
-
-        # 32-bit/64-bit seconds
-        patterns["epoch_sec_le32"] = struct.pack("<I", epoch_sec & 0xFFFFFFFF)
-        patterns["epoch_sec_be32"] = struct.pack(">I", epoch_sec & 0xFFFFFFFF)
-        patterns["epoch_sec_le64"] = struct.pack("<Q", epoch_sec)
-        patterns["epoch_sec_be64"] = struct.pack(">Q", epoch_sec)
-
-        # 64-bit milliseconds
-        patterns["epoch_ms_le64"] = struct.pack("<Q", epoch_ms)
-        patterns["epoch_ms_be64"] = struct.pack(">Q", epoch_ms)
-
-        return patterns
+        return _build_binary_patterns(time_dt)
 
     def get_file_mod_time_for_search(self, file_path):
         """Get file modification time for deep search"""
@@ -2608,19 +2996,64 @@ class FactoryResetGUI(QMainWindow):
         # (사용자가 수동으로 저장할 수 있음)
     
     def _convert_to_json_serializable(self, obj):
-        """datetime 객체를 JSON 직렬화 가능한 형태로 변환"""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {key: self._convert_to_json_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [self._convert_to_json_serializable(item) for item in obj]
-        elif isinstance(obj, (int, float, str, bool, type(None))):
+        """datetime 객체를 JSON 직렬화 가능한 형태로 변환 (반복 구현)
+
+        재귀 대신 명시적 스택을 사용해 깊은 트리에서도 재귀 한도에 걸리지
+        않고, 변환할 값이 하나도 없으면 트리를 복사하지 않고 원본을 그대로
+        반환한다. 라이브 데이터가 datetime을 계속 쓰므로 제자리 수정은
+        하지 않는다.
+        """
+        # 1차: 변환 필요 여부만 확인 (할당 없는 순회)
+        stack = [obj]
+        needs_convert = False
+        while stack:
+            cur = stack.pop()
+            if isinstance(cur, dict):
+                stack.extend(cur.values())
+            elif isinstance(cur, (list, tuple)):
+                stack.extend(cur)
+            elif not isinstance(cur, (int, float, str, bool, type(None))):
+                needs_convert = True
+                break
+        if not needs_convert:
             return obj
-        else:
+
+        # 2차: 필요한 경우에만 사본 구성
+        def _leaf(value):
+            if isinstance(value, datetime):
+                return value.isoformat()
+            if isinstance(value, (int, float, str, bool, type(None))):
+                return value
             # 기타 타입은 문자열로 변환
-            return str(obj)
-    
+            return str(value)
+
+        if isinstance(obj, dict):
+            root = {}
+        elif isinstance(obj, (list, tuple)):
+            root = []
+        else:
+            return _leaf(obj)
+        stack = [(obj, root)]
+        while stack:
+            src, dst = stack.pop()
+            if isinstance(src, dict):
+                for key, value in src.items():
+                    if isinstance(value, (dict, list, tuple)):
+                        child = {} if isinstance(value, dict) else []
+                        dst[key] = child
+                        stack.append((value, child))
+                    else:
+                        dst[key] = _leaf(value)
+            else:
+                for value in src:
+                    if isinstance(value, (dict, list, tuple)):
+                        child = {} if isinstance(value, dict) else []
+                        dst.append(child)
+                        stack.append((value, child))
+                    else:
+                        dst.append(_leaf(value))
+        return root
+
     def save_analysis_result(self):
         """분석 결과를 JSON 파일로 저장"""
         try:
@@ -2724,16 +3157,14 @@ class FactoryResetGUI(QMainWindow):
                                 continue
                             try:
                                 filepath = os.path.join(results_dir, filename)
-                                with open(filepath, 'r', encoding='utf-8') as f:
-                                    data = json.load(f)
+                                data = _json_load_file(filepath)
                                 saved_filename = data.get('saved_filename', filename)
                                 display_name = saved_filename.replace('.json', '')
                                 
                                 # 파일명 파싱
                                 parts = display_name.split()
-                                if len(parts) >= 1:
-                                    # Check for order pattern: "N차" or "ExN" format
-                                    if '차' in parts[0] or (parts[0].startswith('Ex') and len(parts[0]) > 2 and parts[0][2:].isdigit()):
+                                if parts:
+                                    if _ORDER_RE.search(parts[0]):
                                         existing_orders.add(parts[0])
                                         if len(parts) >= 2:
                                             existing_manufacturers.add(parts[1])
@@ -2911,9 +3342,8 @@ class FactoryResetGUI(QMainWindow):
             model_name = ''
             scenario = ''
             
-            if len(parts) >= 1:
-                # Check for order pattern: "N차" or "ExN" format
-                if '차' in parts[0] or (parts[0].startswith('Ex') and len(parts[0]) > 2 and parts[0][2:].isdigit()):
+            if parts:
+                if _ORDER_RE.search(parts[0]):
                     order = parts[0]
                     if len(parts) >= 2:
                         manufacturer = parts[1]
@@ -2945,12 +3375,8 @@ class FactoryResetGUI(QMainWindow):
             
             self.log(f"[결과 저장] 저장 시도: {filepath}")
             
-            # JSON 직렬화 가능한 형태로 변환 (모든 datetime 객체 처리)
-            serializable_data = self._convert_to_json_serializable(save_data)
-            
-            # JSON 파일로 저장
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(serializable_data, f, ensure_ascii=False, indent=2)
+            # JSON 파일로 저장 (datetime 변환은 표준 json 폴백에서만 수행)
+            _json_dump_file(filepath, save_data, self._convert_to_json_serializable)
             
             self.log(f"[결과 저장 성공] {filename}")
             self.log(f"[저장 위치] {results_dir}")
@@ -3001,37 +3427,15 @@ class FactoryResetGUI(QMainWindow):
                     
                     filepath = os.path.join(results_dir, filename)
                     try:
-                        with open(filepath, 'r', encoding='utf-8') as f:
-                            data = json.load(f)
-                        
+                        data = _json_load_file(filepath)
+
                         # 사용자가 지정한 파일명 사용 (없으면 실제 파일명 사용)
                         saved_filename = data.get('saved_filename', filename)
                         display_name = saved_filename.replace('.json', '')
                         
-                        # 파일명 파싱
-                        parts = display_name.split()
-                        order = '기타'
-                        manufacturer = ''
-                        model = ''
-                        scenario = ''
-                        
-                        if len(parts) >= 1:
-                            # Check for order pattern: "N차" or "ExN" format
-                            if '차' in parts[0] or (parts[0].startswith('Ex') and len(parts[0]) > 2 and parts[0][2:].isdigit()):
-                                order = parts[0]
-                                remaining = parts[1:] if len(parts) > 1 else []
-                            else:
-                                remaining = parts
-                            
-                            if len(remaining) >= 3:
-                                manufacturer = remaining[0]
-                                model = remaining[1]
-                                scenario = ' '.join(remaining[2:])
-                            elif len(remaining) == 2:
-                                manufacturer = remaining[0]
-                                model = remaining[1]
-                            elif len(remaining) == 1:
-                                model = remaining[0]
+                        # 파일명 파싱 (메모이즈된 공용 파서)
+                        order, manufacturer, model, scenario = _parse_saved_filename(display_name)
+                        order = order or '기타'
                         
                         file_info = {
                             'filename': filename,
@@ -3089,44 +3493,11 @@ class FactoryResetGUI(QMainWindow):
             for file_info in file_list:
                 display_name = file_info['display_name']
                 
-                # 공백으로 분리
-                parts = display_name.split()
-                
-                # 차수 추출 (첫 번째 부분이 "N차" 형식인지 확인)
-                order = '기타'
-                manufacturer = ''
-                model = ''
-                
-                if len(parts) >= 1:
-                    # 첫 번째 부분이 차수인지 확인 (예: "1차", "2차", "Ex1", "Ex2")
-                    if '차' in parts[0] or (parts[0].startswith('Ex') and len(parts[0]) > 2 and parts[0][2:].isdigit()):
-                        order = parts[0]
-                        remaining = parts[1:] if len(parts) > 1 else []
-                    else:
-                        remaining = parts
-                    
-                    # 나머지 부분에서 제조사, 모델명, 시나리오명 추출
-                    if len(remaining) >= 3:
-                        # 제조사, 모델명, 시나리오명이 모두 있는 경우
-                        manufacturer = remaining[0]
-                        model = remaining[1]
-                        # 시나리오명은 나머지 전체 (여러 단어일 수 있음)
-                    elif len(remaining) == 2:
-                        # 제조사와 모델명만 있는 경우
-                        manufacturer = remaining[0]
-                        model = remaining[1]
-                    elif len(remaining) == 1:
-                        # 모델명만 있는 경우
-                        manufacturer = ''
-                        model = remaining[0]
-                    else:
-                        manufacturer = ''
-                        model = ''
-                    
-                    # 모델명이 없으면 전체를 모델명으로
-                    if not model:
-                        model = display_name
-                else:
+                # 차수·제조사·모델명 추출 (시나리오명은 그룹화 키에서 제외)
+                order, manufacturer, model, _scenario = _parse_saved_filename(display_name)
+                order = order or '기타'
+                # 모델명이 없으면 전체를 모델명으로
+                if not model:
                     model = display_name
                 
                 # 그룹화 키 생성 (차수 + 제조사 + 모델명, 시나리오명은 제외)
@@ -3445,6 +3816,12 @@ class FactoryResetGUI(QMainWindow):
         except:
             pass
     
+    @staticmethod
+    def _order_sort_key(text):
+        """정렬 키: 선행 숫자는 정수로 비교 (예: '2차' < '10차'), 숫자가 없으면 뒤로"""
+        m = re.match(r'\D*?(\d+)', text)
+        return (int(m.group(1)), text) if m else (10 ** 9, text)
+
     def _update_saved_results_tree(self, file_list):
         """저장된 결과 트리 업데이트 (내부 메서드)"""
         try:
@@ -3475,24 +3852,25 @@ class FactoryResetGUI(QMainWindow):
                     groups[order][group_key] = []
                 
                 groups[order][group_key].append(file_info)
-            
-            # 트리 구성
-            for order in sorted(groups.keys()):
-                order_item = QTreeWidgetItem(self.saved_results_tree)
-                order_item.setText(0, order)
-                order_item.setExpanded(True)
-                
-                for group_key in sorted(groups[order].keys()):
-                    model_item = QTreeWidgetItem(order_item)
-                    model_item.setText(0, group_key)
-                    model_item.setExpanded(True)
-                    
-                    # 해당 그룹의 파일들
-                    for file_info in groups[order][group_key]:
-                        result_item = QTreeWidgetItem(model_item)
-                        result_item.setText(0, file_info['display_name'])
-                        result_item.setData(0, Qt.UserRole, file_info['filepath'])
-                        result_item.setData(0, Qt.UserRole + 1, file_info['data'])
+
+            # 트리 구성 (재구성 동안 선택/변경 시그널 억제)
+            with QSignalBlocker(self.saved_results_tree):
+                for order in sorted(groups.keys(), key=self._order_sort_key):
+                    order_item = QTreeWidgetItem(self.saved_results_tree)
+                    order_item.setText(0, order)
+                    order_item.setExpanded(True)
+
+                    for group_key in sorted(groups[order].keys(), key=self._order_sort_key):
+                        model_item = QTreeWidgetItem(order_item)
+                        model_item.setText(0, group_key)
+                        model_item.setExpanded(True)
+
+                        # 해당 그룹의 파일들
+                        for file_info in groups[order][group_key]:
+                            result_item = QTreeWidgetItem(model_item)
+                            result_item.setText(0, file_info['display_name'])
+                            result_item.setData(0, Qt.UserRole, file_info['filepath'])
+                            result_item.setData(0, Qt.UserRole + 1, file_info['data'])
         except Exception as e:
             import traceback
             error_msg = f"[트리 업데이트 오류] {str(e)}\n{traceback.format_exc()}"
@@ -3562,7 +3940,7 @@ class FactoryResetGUI(QMainWindow):
                     time_value = None
                     if data_item.get('time'):
                         try:
-                            time_value = datetime.fromisoformat(data_item['time'])
+                            time_value = _parse_iso(data_item['time'])
                         except:
                             try:
                                 time_value = datetime.fromtimestamp(float(data_item['time']))
@@ -3570,8 +3948,8 @@ class FactoryResetGUI(QMainWindow):
                                 pass
                     
                     self.artifact_data[artifact_id].append({
-                        'name': data_item.get('name'),
-                        'path': data_item.get('path'),
+                        'name': _intern_str(data_item.get('name')),
+                        'path': _intern_str(data_item.get('path')),
                         'time': time_value,
                         'message': data_item.get('message'),
                         'is_kst': data_item.get('is_kst', False),
@@ -3622,10 +4000,9 @@ class FactoryResetGUI(QMainWindow):
                     # Collect file list from original analysis target path (for deep search)
                     if source == "1":  # ZIP
                         try:
-                            # ZIP 파일 열기 (zip_ref는 나중에 사용할 수 있도록 유지)
-                            zip_ref = zipfile.ZipFile(file_path, 'r')
-                            self.reset_instance.file_list = zip_ref.namelist()
-                            self.reset_instance.zipref = zip_ref
+                            # ZIP 파일 열기 (zipref는 나중에 사용할 수 있도록 유지)
+                            # file_list는 lazy property가 namelist를 한 번만 계산
+                            self.reset_instance.zipref = zipfile.ZipFile(file_path, 'r')
                             self.reset_instance.zipfile = file_path
                             self.log(f"[Deep Search Preparation] ZIP file list collected: {len(self.reset_instance.file_list)} files")
                         except Exception as e:
@@ -3658,14 +4035,7 @@ class FactoryResetGUI(QMainWindow):
                 self.log(error_msg)
             except:
                 pass
-        except Exception as e:
-            import traceback
-            error_msg = f"[저장된 결과 로드 오류] {str(e)}\n{traceback.format_exc()}"
-            try:
-                self.log(error_msg)
-            except:
-                pass
-    
+
     def delete_saved_result(self):
         """선택된 저장 결과 삭제"""
         selected = self.saved_results_tree.selectedItems()
@@ -3701,12 +4071,79 @@ class ResetClassGUI:
         self.zipfile = None
         self.zipref = None
         self.base_path = None
-        self.file_list = []
+        self._file_list = None
+        self._file_set = None
+        self._zip_info_map = None
+        self._folder_stat_map = {}
         self.adb_device_id = None  # 여러 디바이스가 있을 때 사용할 디바이스 ID
+        self._adb_ls_cache = {}  # 경로 -> 존재 여부 (일괄 ls 결과 캐시)
+        self._folder_path_cache = {}  # 폴더 모드: 논리 경로 -> 실제 경로(없으면 None) 캐시
+        self._ts_cache = {}  # timestamp_process 입력값 -> datetime 변환 결과 캐시
+        self._wellbing_query_cache = {}  # (choice, db_file, query) -> 조회 결과 캐시
+        self._user_path_cache = _UNSET  # get_user_path 결과 (첫 호출 시 결정)
+        self._user_ids = None  # file_list 구성 시 함께 수집한 user id 집합
+        self._python_cmd = _UNSET  # ccl_abx.py용 파이썬 명령 (첫 사용 시 결정)
+        self._adb_shell = None  # 영속 adb shell 세션 (첫 사용 시 기동)
+        self._adb_shell_lock = threading.Lock()
+        self._adb_mtime_cache = {}  # 경로 -> 수정 시간 (adb_batch_read가 채움)
+        self._adb_cmd = None  # find_adb_path 결과 캐시 (첫 호출 시 결정)
+        self._adb_args_prefix = None  # (device_id, [adb, -s, id]) 접두부 캐시
         self.last_abx_output = None
+
+        # 모드별 구현을 한 번만 바인딩 (호출마다 choice 분기 제거)
+        # ZIP과 Folder는 search_zip/read_file 계열을 공유
+        if choice == "2":  # ADB
+            self._file_exists_impl = self.adb_file_exists
+            self._read_file_impl = self.adb_read_file
+            self._read_file_bytes_impl = self.adb_read_file_bytes
+        else:  # ZIP or Folder
+            self._file_exists_impl = self.search_zip
+            self._read_file_impl = self.read_file
+            self._read_file_bytes_impl = self.read_file_bytes
+
+        # 아티팩트 후보 경로 테이블 (모드 결정 후 한 번만 구성)
+        # suggestions_tpl은 user_id를 format으로 채우는 템플릿
+        if choice == "2":  # ADB
+            self._targets = {
+                "recovery": [
+                    "/data/log/Recovery.log",
+                    "/data/log/recovery.log",
+                    "/cache/recovery/log",
+                ],
+                "last_log": ["/cache/recovery/last_log"],
+                "suggestions_tpl": [
+                    "/data/data/com.android.settings.intelligence/shared_prefs/suggestions.xml",
+                    "/data/user/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml",
+                    "/data/user_de/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml",
+                ],
+            }
+        else:  # ZIP or Folder
+            self._targets = {
+                "recovery": [
+                    "Dump/data/log/Recovery.log",
+                    "Dump/data/log/recovery.log",
+                    "Dump/cache/recovery/log",
+                ],
+                "last_log": [
+                    "Dump/cache/recovery/last_log",
+                    "Dump/mnt/rescue/recovery/last_log",
+                    "Dump/mnt/rescue/recovery/last_log.1",
+                    "Dump/mnt/rescue/recovery/last_kmsg",
+                    "Dump/mnt/rescue/recovery/last_kmsg.1",
+                ],
+                "suggestions_tpl": [
+                    "Dump/data/data/com.android.settings.intelligence/shared_prefs/suggestions.xml",
+                    "Dump/data/user/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml",
+                    "Dump/data/user_de/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml",
+                ],
+            }
         
         # 로그 파일 설정
         self.log_file = None
+        self._log_mday = -1  # 날짜 접두어 캐시 (날짜가 바뀔 때만 갱신)
+        self._log_date_str = ""
+        self._log_pending = 0  # flush 배치 카운터
+        self._log_lock = threading.Lock()  # 병렬 핸들러의 동시 로그 기록 보호
         self.setup_logging()
     
     def setup_logging(self):
@@ -3724,29 +4161,104 @@ class ResetClassGUI:
             # 로그 파일 생성 실패해도 계속 진행
             pass
     
+    def _get_zipref(self):
+        """세션 동안 유지되는 ZipFile 핸들 반환 (없으면 지연 오픈)
+
+        읽기마다 ZipFile을 새로 열면 central directory를 매번 다시
+        파싱하므로, run_analysis에서 연 핸들을 재사용한다.
+        """
+        if self.zipref is None:
+            self.zipref = zipfile.ZipFile(self.zipfile, 'r')
+            self._file_list = None
+            self._zip_info_map = None
+        return self.zipref
+
+    @property
+    def file_list(self):
+        """파일 목록 (ZIP 모드에서는 namelist를 한 번만 계산하여 캐시)"""
+        if self._file_list is None:
+            if self.zipref is not None:
+                self._file_list = self.zipref.namelist()
+                # 목록을 만드는 같은 패스에서 user id까지 수집 (재스캔 방지)
+                self._user_ids = self._collect_user_ids(self._file_list)
+            else:
+                self._file_list = []
+        return self._file_list
+
+    @file_list.setter
+    def file_list(self, value):
+        self._file_list = value
+        self._file_set = None
+
+    @staticmethod
+    def _collect_user_ids(paths):
+        """경로 목록에서 data/user/<id> 의 id 집합 추출"""
+        user_ids = set()
+        match = _USER_PREFIX_RE.match
+        for path in paths:
+            m = match(path)
+            if m:
+                user_ids.add(m.group(1))
+        return user_ids
+
+    @property
+    def file_set(self):
+        """파일 목록의 frozenset (O(1) 멤버십 검사용)"""
+        if self._file_set is None:
+            self._file_set = frozenset(self.file_list)
+        return self._file_set
+
+    @property
+    def zip_info_map(self):
+        """ZIP 엔트리 이름 -> ZipInfo 매핑 (한 번만 계산, O(1) 조회용)"""
+        if self._zip_info_map is None:
+            if self.zipref is not None:
+                self._zip_info_map = {info.filename: info for info in self.zipref.infolist()}
+            else:
+                self._zip_info_map = {}
+        return self._zip_info_map
+
     def log_to_file(self, message):
         """파일에만 기록 (GUI 출력 없이)"""
         try:
             if self.log_file:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-                self.log_file.write(f"[{timestamp}] {message}\n")
-                self.log_file.flush()  # 즉시 디스크에 쓰기
+                # strftime 대신 캐시된 날짜 접두어 + 정수 포맷 (로그가 많을 때 비용 절감)
+                t = time.localtime()
+                with self._log_lock:
+                    if t.tm_mday != self._log_mday:
+                        self._log_mday = t.tm_mday
+                        self._log_date_str = f"{t.tm_year:04d}-{t.tm_mon:02d}-{t.tm_mday:02d}"
+                    self.log_file.write(f"[{self._log_date_str} {t.tm_hour:02d}:{t.tm_min:02d}:{t.tm_sec:02d}] {message}\n")
+                    # 매 줄 flush 대신 배치 flush (에러 시에는 log_error에서 즉시 flush)
+                    self._log_pending += 1
+                    if self._log_pending >= 50:
+                        self.log_file.flush()
+                        self._log_pending = 0
         except Exception:
             pass
     
     def log(self, message):
         """출력 메서드 - QTextEdit에 텍스트 추가 및 파일에 기록"""
         try:
-            # GUI에 출력
-            if self.output_widget:
+            # GUI 출력은 시그널로 메인 스레드에 전달한다 — 핸들러가
+            # 워커 스레드에서 돌 때 QTextEdit을 직접 만지면 안 된다
+            if self.gui_instance is not None:
+                self.gui_instance.log_received.emit(message)
+            elif self.output_widget:
                 self.output_widget.append(message)
-            
+
             # 파일에 기록
             self.log_to_file(message)
         except Exception:
             # 로깅 실패해도 계속 진행
             pass
     
+    def log_many(self, lines):
+        """여러 줄을 한 번에 출력 (핫 루프에서 줄마다 append/기록하는 비용 절감)"""
+        if not lines:
+            return
+        self.log("\n".join(lines))
+
     def log_error(self, message, exception=None):
         """에러 로깅 (상세 정보 포함)"""
         error_msg = f"[ERROR] {message}"
@@ -3754,19 +4266,35 @@ class ResetClassGUI:
             error_msg += f"\n{str(exception)}"
             error_msg += f"\n{traceback.format_exc()}"
         self.log(error_msg)
+        # 에러는 즉시 디스크에 기록
+        try:
+            if self.log_file:
+                self.log_file.flush()
+                self._log_pending = 0
+        except Exception:
+            pass
     
     def log_performance(self, operation, duration):
         """성능 로깅"""
         self.log(f"[PERFORMANCE] {operation}: {duration:.2f}초")
     
     def __del__(self):
-        """소멸자 - 로그 파일 닫기"""
+        """소멸자 - 로그 파일 및 ZIP 핸들 닫기"""
         try:
             if self.log_file:
                 self.log_file.close()
         except:
             pass
-    
+        try:
+            if self.zipref:
+                self.zipref.close()
+        except:
+            pass
+        try:
+            self._close_adb_shell()
+        except:
+            pass
+
     def run_analysis(self):
         """분석 실행"""
         start_time = datetime.now()
@@ -3784,9 +4312,9 @@ class ResetClassGUI:
 
                 try:
                     zip_start = datetime.now()
-                    with zipfile.ZipFile(self.file_path, 'r') as zip_ref:
-                        self.zipref = zip_ref
-                        self.file_list = zip_ref.namelist()
+                    # deep search에서 재사용하므로 핸들을 닫지 않고 유지 (__del__에서 닫음)
+                    self.zipref = zipfile.ZipFile(self.file_path, 'r')
+                    self._file_list = None
                     zip_duration = (datetime.now() - zip_start).total_seconds()
                     self.log_performance("ZIP 파일 열기", zip_duration)
                     self.log(f"[ZIP 파일] 파일 수: {len(self.file_list)}")
@@ -3872,200 +4400,155 @@ class ResetClassGUI:
         """아티팩트를 처리해야 하는지 확인"""
         return "0" in self.artifact_choices or artifact_id in self.artifact_choices
 
+    # 아티팩트 디스패치 테이블: (아티팩트 ID 별칭, user_id 필요 여부, 핸들러 이름, 지원 모드)
+    _ARTIFACT_DISPATCH = (
+        (("1",), False, "process_bootstat", ("1", "3")),
+        (("21", "2-1"), False, "process_recovery_log", ("1", "2", "3")),
+        (("22", "2-2"), False, "process_last_log", ("1", "2", "3")),
+        (("3",), True, "process_suggestions", ("1", "2", "3")),
+        (("4",), False, "process_persistent_properties", ("1", "2", "3")),
+        (("5",), False, "process_appops", ("1", "2", "3")),
+        (("6",), False, "process_wellbing", ("1", "2", "3")),
+        (("7",), True, "process_internal", ("1", "2", "3")),
+        (("8",), False, "process_err", ("1", "2", "3")),
+        (("9",), True, "process_ulr", ("1", "3")),
+    )
+
+    # 아티팩트별 후보 경로 템플릿 (호출마다 리스트를 재조립하지 않고,
+    # ADB 일괄 존재 확인(_prefetch_adb_artifacts)에서도 같은 목록을 쓴다)
+    _INTERNAL_DB_ZIP_TPL = (
+        "Dump/data/data/com.android.providers.media/databases/internal.db",
+        "Dump/data/user/{user_id}/com.google.android.providers.media.module/database/internal.db",
+        "Dump/data/data/com.android.providers.media.module/databases/internal.db",
+        "Dump/data/data/com.google.android.providers.media.module/databases/internal.db",
+        "Dump/data/user/{user_id}/com.android.providers.media.module/databases/internal.db",
+    )
+    _INTERNAL_DB_ADB_TPL = (
+        "/data/data/com.android.providers.media/databases/internal.db",
+        "/data/user/{user_id}/com.google.android.providers.media.module/databases/internal.db",
+        "/data/data/com.android.providers.media.module/databases/internal.db",
+        "/data/user/{user_id}/com.android.providers.media.module/databases/internal.db",
+    )
+    _ULR_ZIP_TPL = (
+        "Dump/data/data/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml",
+        "Dump/data/user/{user_id}/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml",
+    )
+    _ULR_ADB_TPL = (
+        "/data/data/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml",
+        "/data/user/{user_id}/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml",
+    )
+
+    def _prefetch_adb_artifacts(self, user_id):
+        """ADB 모드: 모든 아티팩트 후보 경로의 존재 여부를 한 번에 조회
+
+        프로세서마다 개별 왕복으로 확인하는 대신 전체 후보를 모아
+        ls -d 한 번으로 캐시를 채운다. 이후 각 프로세서의
+        adb_file_exists/_adb_exists_many 호출은 모두 캐시 적중이 된다.
+        """
+        paths = []
+        paths += self._targets["recovery"]
+        paths += self._targets["last_log"]
+        paths += [tpl.format(user_id=user_id) for tpl in self._targets["suggestions_tpl"]]
+        paths += [
+            "/data/property/persistent_properties",
+            "/data/system/appops.xml",
+            "/data/system/users/service/data/eRR.p",
+            "/data/data/com.google.android.apps.wellbeing/databases/app_usage",
+            "/data/data/com.samsung.android.forest/databases/dwbCommon.db",
+        ]
+        paths += [t.format(user_id=user_id) for t in self._INTERNAL_DB_ADB_TPL]
+        self._adb_exists_many(paths)
+
+    def _run_artifact_handlers(self, user_id):
+        """디스패치 테이블 기반 아티팩트 처리 (모든 모드 공통)"""
+        if self.choice == "2":
+            self._prefetch_adb_artifacts(user_id)
+        jobs = []
+        for aliases, needs_user, handler_name, modes in self._ARTIFACT_DISPATCH:
+            if self.choice not in modes:
+                continue
+            if not any(self.should_process_artifact(a) for a in aliases):
+                continue
+            jobs.append((aliases[0], needs_user, getattr(self, handler_name)))
+
+        def run_one(aid, needs_user, handler):
+            try:
+                if needs_user:
+                    handler(user_id)
+                else:
+                    handler()
+            except Exception as e:
+                self.log_error(f"[{aid}] 아티팩트 처리 중 오류", e)
+
+        # ZIP/폴더 모드는 핸들러가 서로 다른 파일만 다루므로 병렬 실행
+        # (ADB는 셸이 단일 자원이므로 순차 유지)
+        if self.choice in ("1", "3") and len(jobs) > 1:
+            self.file_list  # namelist 캐시를 워커 시작 전에 채워 둔다
+            pool_start = datetime.now()
+            with ThreadPoolExecutor(max_workers=min(len(jobs), os.cpu_count() or 1)) as executor:
+                for aid, needs_user, handler in jobs:
+                    executor.submit(run_one, aid, needs_user, handler)
+            self.log_performance("아티팩트 병렬 처리", (datetime.now() - pool_start).total_seconds())
+        else:
+            for aid, needs_user, handler in jobs:
+                run_one(aid, needs_user, handler)
+
     def process_artifacts_zip(self, user_id):
         """ZIP 모드에서 아티팩트 처리"""
         try:
-            # artifact 1: bootstat
-            if self.should_process_artifact("1"):
-                target_file_in_bootstat = "Dump/data/misc/bootstat/factory_reset"
-                target_file_in_bootstat_current = "Dump/data/misc/bootstat/factory_reset_current_time"
-                matchtime = self.get_mod_time_from_zip(target_file_in_bootstat)
-                matchtime_current = self.get_mod_time_from_zip(target_file_in_bootstat_current)
-                self.log("******************************************")
-                self.log(f"[1] [PATH : {target_file_in_bootstat}]")
-                try:
-                    if matchtime:
-                        self.timestamp_process(matchtime, artifact_id="1", path=target_file_in_bootstat, name="factory_reset")
-                    if matchtime_current:
-                        self.timestamp_process(matchtime_current, artifact_id="1", path=target_file_in_bootstat_current, name="factory_reset_current_time")
-                    if not matchtime and not matchtime_current and self.gui_instance:
-                        self.gui_instance.add_artifact_data(
-                            "1",
-                            "factory_reset",
-                            target_file_in_bootstat,
-                            None,
-                            "파일은 존재하나 시간 정보가 없습니다."
-                        )
-                except Exception as e:
-                    self.log_error("factory_reset 처리 중 오류", e)
-                self.log(f"factory_reset : {matchtime}")
-                self.log(f"factory_reset_current_time : {matchtime_current}")
-                self.log("******************************************\n")
-
-            # artifact 2-1: recovery.log
-            if self.should_process_artifact("21") or self.should_process_artifact("2-1"):
-                try:
-                    self.process_recovery_log_zip()
-                except Exception as e:
-                    self.log_error("recovery.log 처리 중 오류", e)
-
-            # artifact 2-2: last_log
-            if self.should_process_artifact("22") or self.should_process_artifact("2-2"):
-                try:
-                    self.process_last_log_zip()
-                except Exception as e:
-                    self.log_error("last_log 처리 중 오류", e)
-
-            # artifact 3: suggestions.xml
-            if self.should_process_artifact("3"):
-                try:
-                    self.process_suggestions_zip(user_id)
-                except Exception as e:
-                    self.log_error("suggestions.xml 처리 중 오류", e)
-
-            # artifact 4: persistent_properties
-            if self.should_process_artifact("4"):
-                try:
-                    self.process_persistent_properties_zip()
-                except Exception as e:
-                    self.log_error("persistent_properties 처리 중 오류", e)
-
-            # artifact 5: appops
-            if self.should_process_artifact("5"):
-                try:
-                    self.process_appops_zip()
-                except Exception as e:
-                    self.log_error("appops 처리 중 오류", e)
-
-            # artifact 6: wellbing
-            if self.should_process_artifact("6"):
-                try:
-                    self.process_wellbing_zip()
-                except Exception as e:
-                    self.log_error("wellbing 처리 중 오류", e)
-
-            # artifact 7: internal
-            if self.should_process_artifact("7"):
-                try:
-                    self.process_internal_zip(user_id)
-                except Exception as e:
-                    self.log_error("internal 처리 중 오류", e)
-
-            # artifact 8: eRR.p
-            if self.should_process_artifact("8"):
-                try:
-                    self.process_err_zip()
-                except Exception as e:
-                    self.log_error("eRR.p 처리 중 오류", e)
-            
-            # artifact 9: ULR_PERSISTENT_PREFS.xml
-            if self.should_process_artifact("9"):
-                try:
-                    self.process_ulr_zip(user_id)
-                except Exception as e:
-                    self.log_error("ULR_PERSISTENT_PREFS.xml 처리 중 오류", e)
+            self._run_artifact_handlers(user_id)
         except Exception as e:
             self.log_error("ZIP 아티팩트 처리 중 치명적 오류", e)
             raise
 
     def process_artifacts_folder(self, user_id):
         """폴더 모드에서 아티팩트 처리 (ZIP과 동일한 로직)"""
-        # artifact 1: bootstat
-        if self.should_process_artifact("1"):
-            target_file_in_bootstat = "Dump/data/misc/bootstat/factory_reset"
-            target_file_in_bootstat_current = "Dump/data/misc/bootstat/factory_reset_current_time"
-            matchtime = self.get_mod_time_from_zip(target_file_in_bootstat)
-            matchtime_current = self.get_mod_time_from_zip(target_file_in_bootstat_current)
-            self.log("******************************************")
-            self.log(f"[1] [PATH : {target_file_in_bootstat}]")
-            try:
-                if matchtime:
-                    self.timestamp_process(matchtime, artifact_id="1", path=target_file_in_bootstat, name="factory_reset")
-                if matchtime_current:
-                    self.timestamp_process(matchtime_current, artifact_id="1", path=target_file_in_bootstat_current, name="factory_reset_current_time")
-                if not matchtime and not matchtime_current and self.gui_instance:
-                    self.gui_instance.add_artifact_data(
-                        "1",
-                        "factory_reset",
-                        target_file_in_bootstat,
-                        None,
-                        "파일은 존재하나 시간 정보가 없습니다."
-                    )
-            except Exception as e:
-                self.log(f"factory_reset : {matchtime}")
-                self.log(f"factory_reset_current_time : {matchtime_current}")
-            self.log("******************************************\n")
-
-        # artifact 2-1: recovery.log
-        if self.should_process_artifact("21") or self.should_process_artifact("2-1"):
-            self.process_recovery_log_folder()
-
-        # artifact 2-2: last_log
-        if self.should_process_artifact("22") or self.should_process_artifact("2-2"):
-            self.process_last_log_folder()
-
-        # artifact 3: suggestions.xml
-        if self.should_process_artifact("3"):
-            self.process_suggestions_folder(user_id)
-
-        # artifact 4: persistent_properties
-        if self.should_process_artifact("4"):
-            self.process_persistent_properties_folder()
-
-        # artifact 5: appops
-        if self.should_process_artifact("5"):
-            self.process_appops_folder()
-
-        # artifact 6: wellbing
-        if self.should_process_artifact("6"):
-            self.process_wellbing_folder()
-
-        # artifact 7: internal
-        if self.should_process_artifact("7"):
-            self.process_internal_folder(user_id)
-
-        # artifact 8: eRR.p
-        if self.should_process_artifact("8"):
-            self.process_err_folder()
-        
-        # artifact 9: ULR_PERSISTENT_PREFS.xml
-        if self.should_process_artifact("9"):
-            self.process_ulr_folder(user_id)
+        self._run_artifact_handlers(user_id)
 
     def process_artifacts_adb(self, user_id):
         """ADB 모드에서 아티팩트 처리"""
-        # ADB 모드의 아티팩트 처리 로직 (기존 코드의 choice == "2" 부분)
-        # artifact 2-1: recovery.log
-        if self.should_process_artifact("21") or self.should_process_artifact("2-1"):
-            self.process_recovery_log_adb()
-
-        # artifact 2-2: last_log
-        if self.should_process_artifact("22") or self.should_process_artifact("2-2"):
-            self.process_last_log_adb()
-
-        # artifact 3: suggestions.xml
-        if self.should_process_artifact("3"):
-            self.process_suggestions_adb(user_id)
-
-        # artifact 4: persistent_properties
-        if self.should_process_artifact("4"):
-            self.process_persistent_properties_adb()
-
-        # artifact 5: appops
-        if self.should_process_artifact("5"):
-            self.process_appops_adb()
+        self._run_artifact_handlers(user_id)
+
+    def process_bootstat(self):
+        """bootstat 처리 (ZIP/Folder 모드)"""
+        target_file_in_bootstat = "Dump/data/misc/bootstat/factory_reset"
+        target_file_in_bootstat_current = "Dump/data/misc/bootstat/factory_reset_current_time"
+        matchtime = self.get_mod_time_from_zip(target_file_in_bootstat)
+        matchtime_current = self.get_mod_time_from_zip(target_file_in_bootstat_current)
+        self.log("******************************************")
+        self.log(f"[1] [PATH : {target_file_in_bootstat}]")
+        try:
+            if matchtime:
+                self.timestamp_process(matchtime, artifact_id="1", path=target_file_in_bootstat, name="factory_reset")
+            if matchtime_current:
+                self.timestamp_process(matchtime_current, artifact_id="1", path=target_file_in_bootstat_current, name="factory_reset_current_time")
+            if not matchtime and not matchtime_current and self.gui_instance:
+                self.gui_instance.add_artifact_data(
+                    "1",
+                    "factory_reset",
+                    target_file_in_bootstat,
+                    None,
+                    "파일은 존재하나 시간 정보가 없습니다."
+                )
+        except Exception as e:
+            self.log_error("factory_reset 처리 중 오류", e)
+        self.log(f"factory_reset : {matchtime}")
+        self.log(f"factory_reset_current_time : {matchtime_current}")
+        self.log("******************************************\n")
 
-        # artifact 6: wellbing
-        if self.should_process_artifact("6"):
+    def process_wellbing(self):
+        """wellbing 처리 (모든 모드 공통)"""
+        if self.choice == "2":
             self.process_wellbing_adb()
+        else:
+            self.process_wellbing_zip()
 
-        # artifact 7: internal
-        if self.should_process_artifact("7"):
+    def process_internal(self, user_id):
+        """internal.db 처리 (모든 모드 공통)"""
+        if self.choice == "2":
             self.process_internal_adb(user_id)
- 
-        # artifact 8: eRR.p
-        if self.should_process_artifact("8"):
-            self.process_err_adb()
+        else:
+            self.process_internal_zip(user_id)
 
     def _parse_recovery_timeline(self, content, file_path, artifact_id):
         """recovery.log/last_log에서 기준 시간과 초기화 관련 로그 시간 계산"""
@@ -4075,16 +4558,13 @@ class ResetClassGUI:
         # 1. get_system_time 패턴 찾기 (기준 시간)
         base_time = None
         base_rel = None
-        
-        # 패턴 1: get_system_time=2024-11-20-08:42:11 형식
-        pattern1 = r'get_system_time=(\d{4}-\d{2}-\d{2})-(\d{2}:\d{2}:\d{2})'
-        # 패턴 2: [상대시간] ... get_system_time= 형식
-        pattern2 = r'\[\s*(\d+\.\d+)\]\s+.*get_system_time=(\d{4}-\d{2}-\d{2})-(\d{2}:\d{2}:\d{2})'
-        
+
+        # 패턴 1: get_system_time=2024-11-20-08:42:11 형식 (_GST_LINE_RE)
+        # 패턴 2: [상대시간] ... get_system_time= 형식 (_GST_REL_LINE_RE)
         lines = content.splitlines()
         for i, line in enumerate(lines):
             # 패턴 2 시도 (상대 시간 포함)
-            m2 = re.search(pattern2, line)
+            m2 = _GST_REL_LINE_RE.search(line)
             if m2:
                 base_rel = float(m2.group(1))
                 try:
@@ -4095,7 +4575,7 @@ class ResetClassGUI:
                     continue
             
             # 패턴 1 시도 (상대 시간 없음)
-            m1 = re.search(pattern1, line)
+            m1 = _GST_LINE_RE.search(line)
             if m1 and base_time is None:
                 try:
                     base_time = datetime.strptime(f"{m1.group(1)} {m1.group(2)}", "%Y-%m-%d %H:%M:%S")
@@ -4107,23 +4587,16 @@ class ResetClassGUI:
             return False
         
         # 2. 초기화 관련 로그 찾기
-        wipe_keywords = [
-            (r'--\s*Wiping\s+data', "초기화 시작"),
-            (r'Data\s+wipe\s+complete', "초기화 완료"),
-            (r'Formatting\s+/data', "데이터 포맷팅 시작"),
-            (r'Info:\s*format\s+successful', "포맷 완료"),
-        ]
-        
         found_events = []
         for i, line in enumerate(lines):
             # 상대 시간 추출 시도
-            rel_match = re.match(r'\[\s*(\d+\.\d+)\]\s+(.*)$', line)
+            rel_match = _REL_LINE_RE.match(line)
             if rel_match:
                 rel_time = float(rel_match.group(1))
                 msg = rel_match.group(2)
-                
-                for pattern, event_name in wipe_keywords:
-                    if re.search(pattern, msg, re.IGNORECASE):
+
+                for pattern, event_name in _WIPE_KEYWORD_PATTERNS:
+                    if pattern.search(msg):
                         if base_rel is not None:
                             # 기준 상대 시간이 있으면 차이 계산
                             abs_time = base_time + timedelta(seconds=(rel_time - base_rel))
@@ -4143,7 +4616,6 @@ class ResetClassGUI:
         
         # 3. 결과를 GUI에 추가
         if found_events and self.gui_instance:
-            import calendar
             # get_system_time 패턴은 KST 기준 (Xiaomi 타임라인과 동일)
             # recovery.log의 "Starting recovery" 패턴은 UTC 0 기준
             is_kst_for_timeline = (artifact_id == "22")  # last_log는 KST, recovery.log는 UTC
@@ -4152,11 +4624,11 @@ class ResetClassGUI:
                 if is_kst_for_timeline:
                     # last_log의 get_system_time은 KST 기준이므로 그대로 사용
                     # KST datetime을 UTC로 변환하려면 9시간 빼기
-                    utc_time = event['abs_time'] - timedelta(hours=9)
-                    utc_timestamp = calendar.timegm(utc_time.utctimetuple())
+                    utc_time = event['abs_time'] - _KST_OFFSET
+                    utc_timestamp = int((utc_time - _EPOCH).total_seconds())
                 else:
                     # recovery.log는 UTC 0 기준
-                    utc_timestamp = calendar.timegm(event['abs_time'].utctimetuple())
+                    utc_timestamp = int((event['abs_time'] - _EPOCH).total_seconds())
                 
                 self.timestamp_process(
                     utc_timestamp,
@@ -4175,19 +4647,17 @@ class ResetClassGUI:
             return False
         
         success = False
-        
+
         # 1. Starting recovery 패턴 (기본)
-        pattern = r'(?:I:)?Starting recovery\s*\(pid\s+\d+\)\s+on\s+([A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4})'
-        matches = re.findall(pattern, content)
-        if matches:
-            time_str = matches[0]
+        # 첫 매치만 쓰므로 search로 조기 종료 (findall은 파일 끝까지 스캔)
+        m = _RECOVERY_START_RE.search(content)
+        if m:
+            time_str = m.group(1)
             try:
                 # recovery.log는 UTC 0 기준이므로 naive datetime을 UTC로 간주
-                dt_naive = datetime.strptime(time_str, "%a %b %d %H:%M:%S %Y")
-                # UTC 기준으로 epoch 계산: calendar.timegm() 사용 (UTC 기준)
-                import calendar
-                utc_timestamp = calendar.timegm(dt_naive.utctimetuple())
-                
+                # epoch 계산은 calendar.timegm() 기반 (UTC 기준), 반복 파싱은 캐시됨
+                dt_naive, utc_timestamp = _parse_recovery_ts(time_str)
+
                 self.log("******************************************")
                 self.log(f"[2-1] [PATH : {file_path}]")
                 self.log(f"recovery.log UTC 시간: {dt_naive} (UTC 0 기준, epoch: {utc_timestamp})")
@@ -4206,70 +4676,52 @@ class ResetClassGUI:
         return success
     
     def _read_file_by_mode(self, file_path):
-        """모드에 따라 파일 읽기"""
-        if self.choice == "1":  # ZIP
-            if self.search_zip(file_path):
-                return self.read_file(file_path)
-        elif self.choice == "2":  # ADB
-            if self.adb_file_exists(file_path):
-                return self.adb_read_file(file_path)
-        elif self.choice == "3":  # Folder
-            if self.search_zip(file_path):  # folder도 search_zip 사용
-                return self.read_file(file_path)
-        return None
-    
+        """모드에 따라 파일 읽기 (구현은 init에서 바인딩, 없으면 None)"""
+        # read_file/adb_read_file 모두 실패 시 None/빈 값을 돌려주므로
+        # 별도의 존재 확인(ADB 왕복, ZIP namelist 조회)은 생략한다
+        return self._read_file_impl(file_path) or None
+
     def _read_file_bytes_by_mode(self, file_path):
-        """모드에 따라 바이너리 파일 읽기"""
-        if self.choice == "1":  # ZIP
-            if self.search_zip(file_path):
-                return self.read_file_bytes(file_path)
-        elif self.choice == "2":  # ADB
-            if self.adb_file_exists(file_path):
-                return self.adb_read_file_bytes(file_path)
-        elif self.choice == "3":  # Folder
-            if self.search_zip(file_path):
-                return self.read_file_bytes(file_path)
-        return None
-    
+        """모드에 따라 바이너리 파일 읽기 (구현은 init에서 바인딩, 없으면 None)"""
+        return self._read_file_bytes_impl(file_path) or None
+
     def _file_exists_by_mode(self, file_path):
-        """모드에 따라 파일 존재 확인"""
-        if self.choice == "1":  # ZIP
-            return self.search_zip(file_path)
-        elif self.choice == "2":  # ADB
-            return self.adb_file_exists(file_path)
-        elif self.choice == "3":  # Folder
-            return self.search_zip(file_path)  # folder도 search_zip 사용
-        return False
+        """모드에 따라 파일 존재 확인 (구현은 init에서 바인딩)"""
+        return bool(self._file_exists_impl(file_path))
     
     def process_recovery_log(self):
         """recovery.log 처리 (모든 모드 공통)"""
         recovery_success = False
         found_path = None
         
-        # 모드에 따라 경로 설정
-        if self.choice == "2":  # ADB
-                targets = [
-                "/data/log/Recovery.log",
-                "/data/log/recovery.log",
-                "/cache/recovery/log",
-            ]
-        else:  # ZIP or Folder
-            targets = [
-                "Dump/data/log/Recovery.log",
-                "Dump/data/log/recovery.log",
-                "Dump/cache/recovery/log",
-            ]
-        
-        for target_file in targets:
-            if self._file_exists_by_mode(target_file):
+        # 모드별 후보 경로 (init에서 한 번만 구성)
+        targets = self._targets["recovery"]
+
+        if self.choice == "2":
+            # exec-out cat 한 번으로 존재 확인과 읽기를 함께 처리 (왕복 절감)
+            for target_file in targets:
+                raw = self._adb_try_read(target_file)
+                if raw is None:
+                    continue
                 found_path = target_file
                 try:
-                    content = self._read_file_by_mode(target_file)
+                    content = raw.decode('utf-8', errors='ignore')
                     if self._parse_recovery_log_content(content, target_file):
                         recovery_success = True
                         break
                 except Exception as e:
                     self.log(f"[2-1] recovery.log 처리 중 오류: {e}")
+        else:
+            for target_file in targets:
+                if self._file_exists_by_mode(target_file):
+                    found_path = target_file
+                    try:
+                        content = self._read_file_by_mode(target_file)
+                        if self._parse_recovery_log_content(content, target_file):
+                            recovery_success = True
+                            break
+                    except Exception as e:
+                        self.log(f"[2-1] recovery.log 처리 중 오류: {e}")
         
         if not recovery_success:
             self.log("******************************************")
@@ -4297,23 +4749,25 @@ class ResetClassGUI:
         """ADB 모드용 (하위 호환성)"""
         self.process_recovery_log()
     
-    def _parse_last_log_content(self, content, raw_bytes, file_path):
-        """last_log 내용 파싱 (공통 로직) - UTC 0 기준"""
+    def _parse_last_log_content(self, content, raw_bytes_provider, file_path):
+        """last_log 내용 파싱 (공통 로직) - UTC 0 기준
+
+        raw_bytes_provider는 바이트를 돌려주는 callable로,
+        Xiaomi 폴백이 실제로 필요할 때만 호출된다 (불필요한 재읽기 방지).
+        """
         success = False
         
         # recovery.log 패턴 시도
         if content:
-            pattern = r'(?:I:)?Starting recovery\s*\(pid\s+\d+\)\s+on\s+([A-Za-z]{3}\s+[A-Za-z]{3}\s+\d{1,2}\s+\d{2}:\d{2}:\d{2}\s+\d{4})'
-            matches = re.findall(pattern, content)
-            if matches:
-                time_str = matches[0]
+            # 첫 매치만 쓰므로 search로 조기 종료 (findall은 파일 끝까지 스캔)
+            m = _RECOVERY_START_RE.search(content)
+            if m:
+                time_str = m.group(1)
                 try:
                     # last_log도 UTC 0 기준이므로 naive datetime을 UTC로 간주
-                    dt_naive = datetime.strptime(time_str, "%a %b %d %H:%M:%S %Y")
-                    # UTC 기준으로 epoch 계산: calendar.timegm() 사용 (UTC 기준)
-                    import calendar
-                    utc_timestamp = calendar.timegm(dt_naive.utctimetuple())
-                    
+                    # epoch 계산은 calendar.timegm() 기반 (UTC 기준), 반복 파싱은 캐시됨
+                    dt_naive, utc_timestamp = _parse_recovery_ts(time_str)
+
                     self.log("******************************************")
                     self.log(f"[2-2] [PATH : {file_path}]")
                     self.log(f"last_log UTC 시간: {dt_naive} (UTC 0 기준, epoch: {utc_timestamp})")
@@ -4332,8 +4786,17 @@ class ResetClassGUI:
             success = True
         
         # Xiaomi 타임라인 시도 (타임라인 분석이 실패한 경우에만)
-        if not timeline_success and raw_bytes:
-            text = raw_bytes.decode("utf-8", errors="ignore")
+        text = None
+        if not timeline_success:
+            if content:
+                # content가 이미 디코딩되어 있으면 재디코딩 없이 그대로 사용
+                text = content
+            elif raw_bytes_provider is not None:
+                # 폴백이 필요할 때만 바이트를 실제로 읽는다
+                raw_bytes = raw_bytes_provider()
+                if raw_bytes:
+                    text = raw_bytes.decode("utf-8", errors="ignore")
+        if text:
             parsed = self.parse_xiaomi_last_log_timeline(text)
             if parsed:
                 self.log("******************************************")
@@ -4342,10 +4805,9 @@ class ResetClassGUI:
                 
                 # base 시간 추가 (KST를 UTC로 변환하여 저장)
                 if self.gui_instance:
-                    import calendar
                     # KST를 UTC로 변환하여 저장
-                    utc_base = parsed['base_dt'] - timedelta(hours=9)
-                    utc_timestamp = calendar.timegm(utc_base.utctimetuple())
+                    utc_base = parsed['base_dt'] - _KST_OFFSET
+                    utc_timestamp = int((utc_base - _EPOCH).total_seconds())
                     self.timestamp_process(
                         utc_timestamp,
                         artifact_id="22",
@@ -4357,19 +4819,21 @@ class ResetClassGUI:
                 
                 # 타임라인 이벤트들도 추가 (초기화 관련만)
                 if self.gui_instance:
-                    import calendar
+                    timeline_lines = []  # 줄마다 log() 호출 대신 모아서 한 번에 출력
                     for abs_str, rel, msg in parsed["timeline"]:
-                        # abs_str에서 시간 추출 (KST)
-                        try:
-                            abs_dt_str = abs_str.replace(" KST", "").strip()
-                            abs_dt = datetime.strptime(abs_dt_str, "%Y-%m-%d %H:%M:%S.%f")
-                            # KST를 UTC로 변환
-                            utc_dt = abs_dt - timedelta(hours=9)
-                            utc_timestamp = calendar.timegm(utc_dt.utctimetuple())
-                            
-                            # 초기화 관련 이벤트만 추가
-                            if any(k in msg for k in ["-- Wiping data", "Data wipe complete", "Formatting /data", "Info: format successful"]):
-                                event_name = "초기화 시작" if "Wiping" in msg else "초기화 완료" if "complete" in msg or "complete" in msg.lower() else "포맷팅"
+                        # 초기화 관련 이벤트만 추가 (키워드별 substring 검사 대신 단일 패턴 스캔)
+                        # 먼저 이벤트 여부를 거른 뒤에만 strptime 수행 (라인 수천 개 중 수 개만 파싱)
+                        m_evt = _WIPE_EVENT_RE.search(msg)
+                        if m_evt:
+                            try:
+                                # abs_str에서 시간 추출 (KST)
+                                abs_dt_str = abs_str.replace(" KST", "").strip()
+                                abs_dt = datetime.strptime(abs_dt_str, "%Y-%m-%d %H:%M:%S.%f")
+                                # KST를 UTC로 변환
+                                utc_dt = abs_dt - _KST_OFFSET
+                                utc_timestamp = int((utc_dt - _EPOCH).total_seconds())
+
+                                event_name = _WIPE_EVENT_NAMES[m_evt.group(0)]
                                 self.timestamp_process(
                                     utc_timestamp,
                                     artifact_id="22",
@@ -4378,10 +4842,11 @@ class ResetClassGUI:
                                     original_time=f"라인: {msg}",
                                     is_kst=True
                                 )
-                        except Exception as e:
-                            self.log(f"[Xiaomi 타임라인 파싱 오류] {abs_str}: {e}")
-                        
-                        self.log(f"{abs_str}  (rel={rel:9.6f}s)  {msg}")
+                            except Exception as e:
+                                self.log(f"[Xiaomi 타임라인 파싱 오류] {abs_str}: {e}")
+
+                        timeline_lines.append(f"{abs_str}  (rel={rel:9.6f}s)  {msg}")
+                    self.log_many(timeline_lines)
                 self.log("******************************************\n")
                 success = True
         
@@ -4392,29 +4857,35 @@ class ResetClassGUI:
         last_log_success = False
         found_path = None
         
-        # 모드에 따라 경로 설정
-        if self.choice == "2":  # ADB
-            targets = ["/cache/recovery/last_log"]
-        else:  # ZIP or Folder
-                targets = [
-                "Dump/cache/recovery/last_log",
-                    "Dump/mnt/rescue/recovery/last_log",
-                    "Dump/mnt/rescue/recovery/last_log.1",
-                    "Dump/mnt/rescue/recovery/last_kmsg",
-                    "Dump/mnt/rescue/recovery/last_kmsg.1",
-                ]
-        
-        for target_file in targets:
-            if self._file_exists_by_mode(target_file):
+        # 모드별 후보 경로 (init에서 한 번만 구성)
+        targets = self._targets["last_log"]
+
+        if self.choice == "2":
+            # exec-out cat 한 번으로 존재 확인과 읽기를 함께 처리 (왕복 절감)
+            for target_file in targets:
+                raw_bytes = self._adb_try_read(target_file)
+                if raw_bytes is None:
+                    continue
                 found_path = target_file
                 try:
-                    content = self._read_file_by_mode(target_file)
-                    raw_bytes = self._read_file_bytes_by_mode(target_file)
-                    if self._parse_last_log_content(content, raw_bytes, target_file):
+                    content = raw_bytes.decode('utf-8', errors='ignore')
+                    if self._parse_last_log_content(content, (lambda raw=raw_bytes: raw), target_file):
                         last_log_success = True
                         break
                 except Exception as e:
                     self.log(f"[2-2] last_log 처리 중 오류: {e}")
+        else:
+            for target_file in targets:
+                if self._file_exists_by_mode(target_file):
+                    found_path = target_file
+                    try:
+                        content = self._read_file_by_mode(target_file)
+                        raw_bytes_provider = (lambda path=target_file: self._read_file_bytes_by_mode(path))
+                        if self._parse_last_log_content(content, raw_bytes_provider, target_file):
+                            last_log_success = True
+                            break
+                    except Exception as e:
+                        self.log(f"[2-2] last_log 처리 중 오류: {e}")
         
         if not last_log_success:
             self.log("******************************************")
@@ -4445,9 +4916,8 @@ class ResetClassGUI:
         """suggestions.xml 내용 파싱 (공통 로직)"""
         if not content:
             return False
-        
-        pattern = r'<long name="com\.android\.settings\.suggested\.category\.DEFERRED_SETUP_setup_time"\s+value="(\d+)"'
-        matches = re.findall(pattern, content)
+
+        matches = _SUGGESTIONS_RE.findall(content)
         if matches:
             self.log("******************************************")
             self.log(f"[3] [PATH : {file_path}]")
@@ -4462,22 +4932,13 @@ class ResetClassGUI:
         """suggestions.xml 처리 (모든 모드 공통)"""
         suggestion_success = False
         found_path = None
-        pattern = r'<long name="com\.android\.settings\.suggested\.category\.DEFERRED_SETUP_setup_time"\s+value="(\d+)"'
-        
-        # 모드에 따라 경로 설정
-        if self.choice == "2":  # ADB
-            targets = [
-                "/data/data/com.android.settings.intelligence/shared_prefs/suggestions.xml",
-                f"/data/user/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml",
-                f"/data/user_de/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml"
-            ]
-        else:  # ZIP or Folder
-            targets = [
-                "Dump/data/data/com.android.settings.intelligence/shared_prefs/suggestions.xml",
-                f"Dump/data/user/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml",
-                f"Dump/data/user_de/{user_id}/com.google.android.settings.intelligence/shared_prefs/suggestions.xml"
-            ]
-        
+        pattern = _SUGGESTIONS_RE
+
+        # 모드별 템플릿에 user_id만 채워서 사용 (init에서 한 번만 구성)
+        targets = [tpl.format(user_id=user_id) for tpl in self._targets["suggestions_tpl"]]
+
+        if self.choice == "2":
+            self._adb_exists_many(targets)
         for target_file in targets:
             if self._file_exists_by_mode(target_file):
                 found_path = target_file
@@ -4529,39 +4990,18 @@ class ResetClassGUI:
         if not content:
             return False
         
-        keyword = "reboot,factory_reset"
         # 패턴: reboot,factory_reset 뒤에 쉼표나 공백/콜론/등호가 오고 10자리 이상 숫자
         # 예: persist.sys.boot.reason.history.reboot,factory_reset,1689128778
-        # 쉼표로 바로 연결된 경우도 처리: reboot,factory_reset,1689128778
-        # 개행 문자도 고려하여 여러 패턴 시도
-        
-        # 패턴 1: 쉼표 바로 뒤에 숫자 (가장 일반적)
-        pattern1 = rf"{re.escape(keyword)},(\d{{10,}})"
-        matches = re.findall(pattern1, content)
-        
-        # 패턴 2: 공백/개행 후 숫자
-        if not matches:
-            pattern2 = rf"{re.escape(keyword)}[\s,:=]+(\d{{10,}})"
-            matches = re.findall(pattern2, content, re.MULTILINE)
-        
-        # 패턴 3: 더 유연한 패턴 (개행 포함)
-        if not matches:
-            pattern3 = rf"{re.escape(keyword)}[,\s:=]+(\d{{10,}})"
-            matches = re.findall(pattern3, content, re.DOTALL)
-        
-        if matches:
-            # 전체 매칭 문자열 찾기 (원본 시간 저장용)
-            full_pattern = rf"{re.escape(keyword)}[,\s:=]+(\d{{10,}})"
-            full_match = re.search(full_pattern, content, re.MULTILINE | re.DOTALL)
-            if full_match:
-                original_time_str = full_match.group(0)
-            else:
-                original_time_str = f"{keyword},{matches[0]}"
-            
+        # 한 번의 search로 값(그룹 1)과 원본 문자열(그룹 0)을 모두 얻는다
+        m = _PERSISTENT_RE_FULL.search(content)
+        if m:
+            matched_value = m.group(1)
+            original_time_str = m.group(0)
+
             self.log("******************************************")
             self.log(f"[4] [PATH : {file_path}]")
-            self.log(f"[4] [매칭된 값] {matches[0]}")
-            self.timestamp_process(matches[0], artifact_id="4", path=file_path, name="persistent_properties", original_time=original_time_str)
+            self.log(f"[4] [매칭된 값] {matched_value}")
+            self.timestamp_process(matched_value, artifact_id="4", path=file_path, name="persistent_properties", original_time=original_time_str)
             self.log("******************************************\n")
             return True
         else:
@@ -4586,34 +5026,10 @@ class ResetClassGUI:
         
         if self._file_exists_by_mode(target_file):
             try:
-                if self.choice in ["1", "3"]:  # ZIP or Folder
-                    keyword = "reboot,factory_reset"
-                    # 패턴: reboot,factory_reset 뒤에 쉼표나 공백/콜론/등호가 오고 10자리 숫자
-                    # 예: persist.sys.boot.reason.history.reboot,factory_reset,1689128778
-                    # 쉼표로 바로 연결된 경우도 처리: reboot,factory_reset,1689128778
-                    # 패턴 수정: 쉼표 바로 뒤에 숫자가 오는 경우도 처리, 10자리 이상 숫자 허용
-                    pattern = rf"{re.escape(keyword)}[,\s:=]+(\d{{10,}})"
-                    resulttime, matches = self.search_timestamp_in_property(target_file, pattern)
-                    if resulttime is not None and matches:
-                        # 전체 매칭 문자열 찾기 (원본 시간 저장용)
-                        content = self._read_file_by_mode(target_file)
-                        if content:
-                            full_pattern = rf"{re.escape(keyword)}[,\s:=]+(\d{{10,}})"
-                            full_match = re.search(full_pattern, content, re.MULTILINE | re.DOTALL)
-                            original_time_str = full_match.group(0) if full_match else matches[0]
-                        else:
-                            original_time_str = matches[0]
-                        
-                        self.log("******************************************")
-                        self.log(f"[4] [PATH : {target_file}]")
-                        self.timestamp_process(matches[0], artifact_id="4", path=target_file, name="persistent_properties", original_time=original_time_str)
-                        self.log("******************************************\n")
-                    else:
-                        content = self._read_file_by_mode(target_file)
-                        self._parse_persistent_properties_content(content, target_file)
-                else:  # ADB
-                    content = self._read_file_by_mode(target_file)
-                    self._parse_persistent_properties_content(content, target_file)
+                # 모든 모드 공통: 한 번 읽고 한 번의 search로 값(그룹 1)과
+                # 원본 문자열(그룹 0)을 함께 얻는다 (재읽기/재스캔 제거)
+                content = self._read_file_by_mode(target_file)
+                self._parse_persistent_properties_content(content, target_file)
             except Exception as e:
                 self.log(f"Persistent properties 처리 중 오류: {e}")
                 import traceback
@@ -4679,53 +5095,8 @@ class ResetClassGUI:
         self.process_appops()
     
     def process_wellbing_zip(self):
-                queryforpixel = """
-                    SELECT events._id,
-                           datetime(events.timestamp/1000, 'UNIXEPOCH') as timestamps,
-                           packages.package_name, events.type,
-                           CASE
-                               when events.type=1 THEN 'ACTIVITY_RESUMED'
-                               when events.type=2 THEN 'ACTIVITY_PAUSED'
-                               when events.type=12 THEN 'NOTIFICATION'
-                               when events.type=18 THEN 'KEYGUARD_HIDDEN || DEVICE UNLOCK'
-                               when events.type=19 THEN 'FOREGROUND_SERVICE START'
-                               when events.type=20 THEN 'FOREGROUND_SERVICE_STOP'
-                               when events.type=23 THEN 'ACTIVITY_STOPPED'
-                               when events.type=26 THEN 'DEVICE_SHUTDOWN'
-                               when events.type=27 THEN 'DEVICE_STARTUP'
-                               else events.type
-                           END as eventtype
-                    FROM events
-                    INNER JOIN packages ON events.package_id=packages._id
-                    ORDER by timestamps
-                """
-                queryforgalaxy = """
-                    SELECT usageEvents.eventId,
-                           datetime(usageEvents.timeStamp/1000, 'UNIXEPOCH') as timestamp,
-                           foundPackages.name, usageEvents.eventType,
-                           CASE
-                               when usageEvents.eventType=1 THEN 'ACTIVITY_RESUMED'
-                               when usageEvents.eventType=2 THEN 'ACTIVITY_PAUSED'
-                               when usageEvents.eventType=5 THEN 'CONFIGURATION_CHANGE'
-                               when usageEvents.eventType=7 THEN 'USER_INTERACTION'
-                               when usageEvents.eventType=10 THEN 'NOTIFICATION PANEL'
-                               when usageEvents.eventType=11 THEN 'STANDBY_BUCKET_CHANGED'
-                               when usageEvents.eventType=12 THEN 'NOTIFICATION'
-                               when usageEvents.eventType=15 THEN 'SCREEN_INTERACTIVE (Screen on for full user interaction)'
-                               when usageEvents.eventType=16 THEN 'SCREEN_NON_INTERACTIVE (Screen on in Non-interactive state or completely turned off)'
-                               when usageEvents.eventType=17 THEN 'KEYGUARD_SHOWN || POSSIBLE DEVICE LOCK'
-                               when usageEvents.eventType=18 THEN 'KEYGUARD_HIDDEN || DEVICE UNLOCK'
-                               when usageEvents.eventType=19 THEN 'FOREGROUND_SERVICE START'
-                               when usageEvents.eventType=20 THEN 'FOREGROUND_SERVICE_STOP'
-                               when usageEvents.eventType=23 THEN 'ACTIVITY_STOPPED'
-                               when usageEvents.eventType=26 THEN 'DEVICE_SHUTDOWN'
-                               when usageEvents.eventType=27 THEN 'DEVICE_STARTUP'
-                               else usageEvents.eventType
-                           END as eventTypeDescription
-                    FROM usageEvents
-                    INNER JOIN foundPackages ON usageEvents.pkgId=foundPackages.pkgId
-                    ORDER BY timestamp
-                """
+                queryforpixel = _WELLBING_QUERY_PIXEL
+                queryforgalaxy = _WELLBING_QUERY_GALAXY
                 wellbing_success = False
                 for target_file in ["Dump/data/data/com.google.android.apps.wellbeing/databases/app_usage",
                                     "Dump/data/data/com.samsung.android.forest/databases/dwbCommon.db"]:
@@ -4752,56 +5123,13 @@ class ResetClassGUI:
         self.process_wellbing_zip()  # 동일한 로직
     
     def process_wellbing_adb(self):
-                queryforpixel = """
-                    SELECT events._id,
-                           datetime(events.timestamp/1000, 'UNIXEPOCH') as timestamps,
-                           packages.package_name, events.type,
-                           CASE
-                               when events.type=1 THEN 'ACTIVITY_RESUMED'
-                               when events.type=2 THEN 'ACTIVITY_PAUSED'
-                               when events.type=12 THEN 'NOTIFICATION'
-                               when events.type=18 THEN 'KEYGUARD_HIDDEN || DEVICE UNLOCK'
-                               when events.type=19 THEN 'FOREGROUND_SERVICE START'
-                               when events.type=20 THEN 'FOREGROUND_SERVICE_STOP'
-                               when events.type=23 THEN 'ACTIVITY_STOPPED'
-                               when events.type=26 THEN 'DEVICE_SHUTDOWN'
-                               when events.type=27 THEN 'DEVICE_STARTUP'
-                               else events.type
-                           END as eventtype
-                    FROM events
-                    INNER JOIN packages ON events.package_id=packages._id
-                    ORDER by timestamps
-                """
-                queryforgalaxy = """
-                    SELECT usageEvents.eventId,
-                           datetime(usageEvents.timeStamp/1000, 'UNIXEPOCH') as timestamp,
-                           foundPackages.name, usageEvents.eventType,
-                           CASE
-                               when usageEvents.eventType=1 THEN 'ACTIVITY_RESUMED'
-                               when usageEvents.eventType=2 THEN 'ACTIVITY_PAUSED'
-                               when usageEvents.eventType=5 THEN 'CONFIGURATION_CHANGE'
-                               when usageEvents.eventType=7 THEN 'USER_INTERACTION'
-                               when usageEvents.eventType=10 THEN 'NOTIFICATION PANEL'
-                               when usageEvents.eventType=11 THEN 'STANDBY_BUCKET_CHANGED'
-                               when usageEvents.eventType=12 THEN 'NOTIFICATION'
-                               when usageEvents.eventType=15 THEN 'SCREEN_INTERACTIVE (Screen on for full user interaction)'
-                               when usageEvents.eventType=16 THEN 'SCREEN_NON_INTERACTIVE (Screen on in Non-interactive state or completely turned off)'
-                               when usageEvents.eventType=17 THEN 'KEYGUARD_SHOWN || POSSIBLE DEVICE LOCK'
-                               when usageEvents.eventType=18 THEN 'KEYGUARD_HIDDEN || DEVICE UNLOCK'
-                               when usageEvents.eventType=19 THEN 'FOREGROUND_SERVICE START'
-                               when usageEvents.eventType=20 THEN 'FOREGROUND_SERVICE_STOP'
-                               when usageEvents.eventType=23 THEN 'ACTIVITY_STOPPED'
-                               when usageEvents.eventType=26 THEN 'DEVICE_SHUTDOWN'
-                               when usageEvents.eventType=27 THEN 'DEVICE_STARTUP'
-                               else usageEvents.eventType
-                           END as eventTypeDescription
-                    FROM usageEvents
-                    INNER JOIN foundPackages ON usageEvents.pkgId=foundPackages.pkgId
-                    ORDER BY timestamp
-                """
+                queryforpixel = _WELLBING_QUERY_PIXEL
+                queryforgalaxy = _WELLBING_QUERY_GALAXY
                 wellbing_success = False
-                for target_file in ["/data/data/com.google.android.apps.wellbeing/databases/app_usage",
-                            "/data/data/com.samsung.android.forest/databases/dwbCommon.db"]:
+                wellbing_targets = ["/data/data/com.google.android.apps.wellbeing/databases/app_usage",
+                            "/data/data/com.samsung.android.forest/databases/dwbCommon.db"]
+                self._adb_exists_many(wellbing_targets)
+                for target_file in wellbing_targets:
                     if self.adb_file_exists(target_file):
                         local_temp = "temp_db.db"
                         if self.adb_pull_file(target_file, local_temp):
@@ -4825,13 +5153,7 @@ class ResetClassGUI:
 
     def process_internal_zip(self, user_id):
                 internal_success = False
-                targets = [
-            "Dump/data/data/com.android.providers.media/databases/internal.db",
-            f"Dump/data/user/{user_id}/com.google.android.providers.media.module/database/internal.db",
-                    "Dump/data/data/com.android.providers.media.module/databases/internal.db",
-            "Dump/data/data/com.google.android.providers.media.module/databases/internal.db",
-                    f"Dump/data/user/{user_id}/com.android.providers.media.module/databases/internal.db"
-                ]
+                targets = [t.format(user_id=user_id) for t in self._INTERNAL_DB_ZIP_TPL]
                 self.log("[경로 후보] internal.db ZIP 검색 경로:")
                 for t in targets:
                     self.log(f"  - {t}")
@@ -4856,15 +5178,11 @@ class ResetClassGUI:
     
     def process_internal_adb(self, user_id):
         internal_success = False
-        targets = [
-            f"/data/data/com.android.providers.media/databases/internal.db",
-            f"/data/user/{user_id}/com.google.android.providers.media.module/databases/internal.db",
-            "/data/data/com.android.providers.media.module/databases/internal.db",
-            f"/data/user/{user_id}/com.android.providers.media.module/databases/internal.db"
-        ]
+        targets = [t.format(user_id=user_id) for t in self._INTERNAL_DB_ADB_TPL]
         self.log("[경로 후보] internal.db ADB 검색 경로:")
         for t in targets:
             self.log(f"  - {t}")
+        self._adb_exists_many(targets)
         for target_file in targets:
             if self.adb_file_exists(target_file):
                 local_temp = "temp_db.db"
@@ -4891,16 +5209,18 @@ class ResetClassGUI:
         """eRR.p 내용 파싱 (공통 로직)"""
         parsed = self.parse_err_rst_stat(content)
         if parsed and self.gui_instance:
-            for dt_str, dt_obj in parsed:
-                self.gui_instance.add_artifact_data(
-                    "8",
-                    "eRR.p (RST_STAT)",
-                    file_path,
-                    dt_obj,
-                    None,
-                    is_kst=True,
-                    original_time=dt_str
-                )
+            # 행마다 GUI 갱신을 일으키지 않도록 한 번에 전달
+            self.gui_instance.add_artifact_data_batch("8", [
+                {
+                    'name': "eRR.p (RST_STAT)",
+                    'path': file_path,
+                    'time': dt_obj,
+                    'message': None,
+                    'is_kst': True,
+                    'original_time': dt_str,
+                }
+                for dt_str, dt_obj in parsed
+            ])
         return parsed
     
     def process_err(self):
@@ -4911,8 +5231,10 @@ class ResetClassGUI:
                 target_file = 'Dump/data/system/users/service/data/eRR.p'
         
         if self._file_exists_by_mode(target_file):
-            result = self._read_file_by_mode(target_file)
-            parsed = self._parse_err_content(result, target_file)
+            raw = self._read_file_bytes_by_mode(target_file)
+            # 디코딩과 splitlines 리스트 없이 바이트 라인 스트림으로 파싱
+            parsed = self._parse_err_content(io.BytesIO(raw) if raw else None, target_file)
+            result = raw.decode('utf-8', errors='ignore') if raw else raw
             if not parsed and self.gui_instance:
                 self.gui_instance.add_artifact_data("8", "eRR.p", target_file, None, str(result) if result else "파일 내용 없음")
         else:
@@ -4938,12 +5260,12 @@ class ResetClassGUI:
         self.process_err()
     
     def _parse_ulr_content(self, content, file_path):
-        """ULR_PERSISTENT_PREFS.xml 내용 파싱 (공통 로직)"""
+        """ULR_PERSISTENT_PREFS.xml 내용 파싱 (공통 로직, str/bytes 모두 허용)"""
         if not content:
             return False
-        
-        pattern = r'<long name="reportingAutoenableManagerInitTimeMillisKey"\s+value="(\d+)"'
-        matches = re.findall(pattern, content)
+
+        # 패턴이 ASCII 전용이므로 bytes 입력은 디코딩 없이 직접 검색
+        matches = (_ULR_RE_B if isinstance(content, bytes) else _ULR_RE).findall(content)
         if matches:
             self.log("******************************************")
             self.log(f"[9] [PATH : {file_path}]")
@@ -4954,51 +5276,30 @@ class ResetClassGUI:
             self.log("******************************************\n")
             return True
         else:
-            self.log_parse_failure(file_path, "ULR_PERSISTENT_PREFS.xml 값 없음", content)
+            preview = content.decode('utf-8', errors='ignore') if isinstance(content, bytes) else content
+            self.log_parse_failure(file_path, "ULR_PERSISTENT_PREFS.xml 값 없음", preview)
         return False
     
     def process_ulr(self, user_id):
         """ULR_PERSISTENT_PREFS.xml 처리 (모든 모드 공통)"""
         ulr_success = False
         found_path = None
-        pattern = r'<long name="reportingAutoenableManagerInitTimeMillisKey"\s+value="(\d+)"'
-        
+
         # 모드에 따라 경로 설정
-        if self.choice == "2":  # ADB
-            targets = [
-                f"/data/data/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml",
-                f"/data/user/{user_id}/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml"
-            ]
-        else:  # ZIP or Folder
-            targets = [
-                "Dump/data/data/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml",
-                f"Dump/data/user/{user_id}/com.google.android.gms/shared_prefs/ULR_PERSISTENT_PREFS.xml"
-            ]
-        
+        templates = self._ULR_ADB_TPL if self.choice == "2" else self._ULR_ZIP_TPL
+        targets = [t.format(user_id=user_id) for t in templates]
+
+        if self.choice == "2":
+            self._adb_exists_many(targets)
         for target_file in targets:
             if self._file_exists_by_mode(target_file):
                 found_path = target_file
                 try:
-                    if self.choice in ["1", "3"]:  # ZIP or Folder
-                        extracted, matches = self.search_timestamp_in_property(target_file, pattern)
-                        if extracted is not None and matches:
-                            self.log("******************************************")
-                            self.log(f"[9] [PATH : {target_file}]")
-                            # millisecond를 second로 변환
-                            timestamp_ms = int(matches[0])
-                            timestamp_s = timestamp_ms / 1000.0
-                            self.timestamp_process(timestamp_s, artifact_id="9", path=target_file, name="ULR_PERSISTENT_PREFS.xml")
-                            self.log("******************************************\n")
-                            ulr_success = True
-                            break
-                        else:
-                            content = self._read_file_by_mode(target_file)
-                            self.log_parse_failure(target_file, "ULR_PERSISTENT_PREFS.xml 값 없음", content)
-                    else:  # ADB
-                        content = self._read_file_by_mode(target_file)
-                        if self._parse_ulr_content(content, target_file):
-                            ulr_success = True
-                            break
+                    # ASCII 패턴이므로 모든 모드에서 디코딩 없이 바이트에서 직접 검색
+                    content = self._read_file_bytes_by_mode(target_file)
+                    if self._parse_ulr_content(content, target_file):
+                        ulr_success = True
+                        break
                 except Exception as e:
                     self.log(f"[9] ULR_PERSISTENT_PREFS.xml 처리 중 오류: {e}")
         
@@ -5032,14 +5333,23 @@ class ResetClassGUI:
         if not content:
             return []
         matches = []
-        pattern = re.compile(r"(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})\+?(\d{4})?.*?RST_STAT", re.IGNORECASE)
-        for line in content.splitlines():
-            m = pattern.search(line)
-            if not m:
-                continue
+        if isinstance(content, (str, bytes)):
+            # bytes 입력은 디코딩 없이 직접 검색하고 매칭된 타임스탬프만 디코딩
+            rst_re = _RST_STAT_RE_B if isinstance(content, bytes) else _RST_STAT_RE
+            found = rst_re.finditer(content)
+        else:
+            # 파일류/라인 iterable: 전체 버퍼 생성 없이 바이트 라인 단위로 검사
+            found = (m for line in content
+                     for m in (_RST_STAT_RE_B.search(line),) if m)
+        for m in found:
             dt_str = m.group(1)
+            if isinstance(dt_str, bytes):
+                dt_str = dt_str.decode('ascii')
             try:
-                dt_obj = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
+                try:
+                    dt_obj = _fast_iso(dt_str)
+                except ValueError:
+                    dt_obj = datetime.strptime(dt_str, "%Y-%m-%d %H:%M:%S")
                 matches.append((dt_str, dt_obj))
             except Exception:
                 continue
@@ -5049,23 +5359,28 @@ class ResetClassGUI:
         """ZIP 파일 또는 해제된 폴더에서 파일 검색"""
         try:
             if self.choice == "1":
-                if target_file not in self.file_list:
+                if target_file not in self.file_set:
                     self.log(f"[경로 후보] ZIP에 없음: {target_file}")
                     return None
                 else:
                     return target_file
             elif self.choice == "3":
+                # 같은 경로를 여러 프로세서가 반복 조회하므로 stat 결과를 캐시
+                if target_file in self._folder_path_cache:
+                    return self._folder_path_cache[target_file]
                 actual_path = self.get_actual_path(target_file)
                 if actual_path and os.path.exists(actual_path):
+                    self._folder_path_cache[target_file] = actual_path
                     return actual_path
                 else:
-                    # 경로 후보 로깅
+                    # 경로 후보 로깅 (첫 조회 시에만)
                     candidates = [os.path.join(self.base_path, target_file)]
                     if isinstance(target_file, str) and target_file.startswith("Dump/"):
                         candidates.append(os.path.join(self.base_path, target_file[len("Dump/"):]))
                     self.log(f"[경로 후보] 파일 없음: {target_file}")
                     for cand in candidates:
                         self.log(f"  - {cand}")
+                    self._folder_path_cache[target_file] = None
                     return None
             else:
                 return None
@@ -5098,29 +5413,21 @@ class ResetClassGUI:
         """ZIP 파일 또는 해제된 폴더에서 파일 읽기"""
         try:
             if self.choice == "1":
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    if target_file not in zip_ref.namelist():
-                        return None
-                    with zip_ref.open(target_file) as file:
-                        raw = file.read()
-                        for enc in ("utf-8", "utf-8-sig", "cp949", "utf-16le", "utf-16be"):
-                            try:
-                                return raw.decode(enc)
-                            except Exception:
-                                continue
-                        return raw.decode("utf-8", errors="ignore")
+                if target_file not in self.file_set:  # namelist 선형 스캔 대신 캐시된 set 조회
+                    return None
+                with self._get_zipref().open(target_file) as file:
+                    # 큰 버퍼로 감싸 압축 해제 시 작은 청크 호출을 줄임
+                    raw = io.BufferedReader(file, buffer_size=262144).read()
+                # 인코딩 후보를 전부 시험하는 대신 BOM/프리픽스로 한 번에 판별
+                return raw.decode(_detect_encoding(raw), errors="ignore")
             elif self.choice == "3":
                 actual_path = self.get_actual_path(target_file) if isinstance(target_file, str) and not os.path.isabs(target_file) else target_file
                 if not actual_path or not os.path.exists(actual_path):
                     return None
                 with open(actual_path, 'rb') as file:
                     raw = file.read()
-                for enc in ("utf-8", "utf-8-sig", "cp949", "utf-16le", "utf-16be"):
-                    try:
-                        return raw.decode(enc)
-                    except Exception:
-                        continue
-                return raw.decode("utf-8", errors="ignore")
+                # 인코딩 후보를 전부 시험하는 대신 BOM/프리픽스로 한 번에 판별
+                return raw.decode(_detect_encoding(raw), errors="ignore")
             else:
                 return None
         except Exception as e:
@@ -5131,11 +5438,11 @@ class ResetClassGUI:
         """ZIP 파일 또는 해제된 폴더에서 파일을 bytes로 읽기"""
         try:
             if self.choice == "1":
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    if target_file not in zip_ref.namelist():
-                        return None
-                    with zip_ref.open(target_file) as file:
-                        return file.read()
+                if target_file not in self.file_set:  # namelist 선형 스캔 대신 캐시된 set 조회
+                    return None
+                with self._get_zipref().open(target_file) as file:
+                    # 큰 버퍼로 감싸 압축 해제 시 작은 청크 호출을 줄임
+                    return io.BufferedReader(file, buffer_size=262144).read()
             elif self.choice == "3":
                 actual_path = self.get_actual_path(target_file) if isinstance(target_file, str) and not os.path.isabs(target_file) else target_file
                 if not actual_path or not os.path.exists(actual_path):
@@ -5153,38 +5460,24 @@ class ResetClassGUI:
         if not content_text:
             return None
 
-        base_dt = None
-        base_rel = None
-        for line in content_text.splitlines():
-            if "get_system_time=" not in line:
-                continue
-            m = re.search(r'^\[\s*(\d+\.\d+)\]\s+.*get_system_time=(\d{4}-\d{2}-\d{2})-(\d{2}:\d{2}:\d{2})', line)
-            if m:
-                base_rel = float(m.group(1))
-                base_dt = datetime.strptime(f"{m.group(2)} {m.group(3)}", "%Y-%m-%d %H:%M:%S")
-                break
-
-        if base_dt is None or base_rel is None:
+        # 베이스 시각은 전체 문자열에 대한 search 한 번으로 획득
+        m = _GST_REL_LINE_RE.search(content_text)
+        if not m:
             return None
-
-        keywords = [
-            "get_system_time=",
-            "-- Wiping data",
-            "Formatting /data",
-            "Info: format successful",
-            "Data wipe complete",
-            "Saving new_status",
-            "enter finish_recovery",
-        ]
+        base_rel = float(m.group(1))
+        base_str = f"{m.group(2)} {m.group(3)}"
+        try:
+            base_dt = _fast_iso(base_str)
+        except ValueError:
+            base_dt = datetime.strptime(base_str, "%Y-%m-%d %H:%M:%S")
 
         timeline = []
-        for line in content_text.splitlines():
-            m = re.match(r'^\[\s*(\d+\.\d+)\]\s+(.*)$', line)
-            if not m:
-                continue
-            rel = float(m.group(1))
+        # splitlines()로 전체 라인 리스트를 만들지 않고 MULTILINE finditer로 단일 패스 스캔
+        for m in _REL_LINE_ML_RE.finditer(content_text):
             msg = m.group(2)
-            if any(k in msg for k in keywords):
+            # 키워드별 substring 검사 대신 컴파일된 alternation 한 번으로 필터
+            if _XIAOMI_KEYWORD_RE.search(msg):
+                rel = float(m.group(1))
                 abs_dt = base_dt + timedelta(seconds=(rel - base_rel))
                 abs_str = abs_dt.strftime("%Y-%m-%d %H:%M:%S.%f")[:-3] + " KST"
                 timeline.append((abs_str, rel, msg))
@@ -5199,14 +5492,18 @@ class ResetClassGUI:
         """ZIP 파일 또는 해제된 폴더에서 파일 수정 시간 가져오기"""
         try:
             if self.choice == "1":
-                if target_file not in self.file_list:
+                info = self.zip_info_map.get(target_file)
+                if info is None:
                     self.log(f"{target_file}이 없습니다")
                     return None
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    info = zip_ref.getinfo(target_file)
-                mod_time = datetime(*info.date_time)
-                return mod_time
+                return datetime(*info.date_time)
             elif self.choice == "3":
+                # collect_folder_files에서 미리 수집한 stat 정보 사용 (파일별 재-stat 방지)
+                st = self._folder_stat_map.get(target_file)
+                if st is None and isinstance(target_file, str) and target_file.startswith("Dump/"):
+                    st = self._folder_stat_map.get(target_file[len("Dump/"):])
+                if st is not None:
+                    return datetime.fromtimestamp(st.st_mtime)
                 actual_path = self.get_actual_path(target_file) if isinstance(target_file, str) and not os.path.isabs(target_file) else target_file
                 if not actual_path or not os.path.exists(actual_path):
                     self.log(f"{target_file}이 없습니다")
@@ -5224,40 +5521,23 @@ class ResetClassGUI:
         try:
             content = None
             if self.choice == "1":
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    if target_file not in zip_ref.namelist():
-                        return None, None
-                    with zip_ref.open(target_file) as file:
-                        raw_bytes = file.read()
-                        # 여러 인코딩 시도
-                        for enc in ['utf-8-sig', 'utf-8', 'cp949', 'latin-1']:
-                            try:
-                                content = raw_bytes.decode(enc)
-                                break
-                            except UnicodeDecodeError:
-                                continue
-                        if content is None:
-                            # 모든 인코딩 실패 시 errors='ignore'로 시도
-                            content = raw_bytes.decode('utf-8', errors='ignore')
+                if target_file not in self.file_set:  # namelist 선형 스캔 대신 캐시된 set 조회
+                    return None, None
+                with self._get_zipref().open(target_file) as file:
+                    raw_bytes = file.read()
+                # 인코딩 후보를 전부 시험하는 대신 BOM/프리픽스로 한 번에 판별
+                content = raw_bytes.decode(_detect_encoding(raw_bytes), errors='ignore')
             elif self.choice == "3":
                 actual_path = self.get_actual_path(target_file) if isinstance(target_file, str) and not os.path.isabs(target_file) else target_file
                 if not actual_path or not os.path.exists(actual_path):
                     return None, None
-                # 여러 인코딩 시도
-                for enc in ['utf-8-sig', 'utf-8', 'cp949', 'latin-1']:
-                    try:
-                        with open(actual_path, 'r', encoding=enc) as file:
-                            content = file.read()
-                        break
-                    except (UnicodeDecodeError, FileNotFoundError):
-                        continue
-                if content is None:
-                    # 모든 인코딩 실패 시 errors='ignore'로 시도
-                    try:
-                        with open(actual_path, 'r', encoding='utf-8', errors='ignore') as file:
-                            content = file.read()
-                    except Exception:
-                        return None, None
+                try:
+                    with open(actual_path, 'rb') as file:
+                        raw_bytes = file.read()
+                except Exception:
+                    return None, None
+                # 인코딩 후보를 전부 시험하는 대신 BOM/프리픽스로 한 번에 판별
+                content = raw_bytes.decode(_detect_encoding(raw_bytes), errors='ignore')
             else:
                 return None, None
             
@@ -5265,7 +5545,8 @@ class ResetClassGUI:
                 return None, None
             
             extracted_values = {}
-            matches = re.findall(pattern, content)
+            # re2 컴파일 객체는 re.findall에 넘길 수 없으므로 메서드로 호출
+            matches = pattern.findall(content)
             if matches:
                 extracted_values[target_file] = matches
             else:
@@ -5275,20 +5556,35 @@ class ResetClassGUI:
             self.log(f"파일 {target_file}을(를) 찾을 수 없습니다. {e}")
             return None, None
 
+    def _resolve_python_cmd(self):
+        """ccl_abx.py 실행용 파이썬 명령 결정 (호출마다 --version 프로브 방지)
+
+        첫 호출에서만 python → python3 순으로 확인하고 결과를 캐시한다.
+        둘 다 없으면 None을 캐시해 이후 호출도 프로브 없이 바로 실패한다.
+        """
+        if self._python_cmd is not _UNSET:
+            return self._python_cmd
+        for candidate in ("python", "python3"):
+            try:
+                subprocess.run([candidate, "--version"], capture_output=True, check=True)
+                self._python_cmd = candidate
+                return candidate
+            except (subprocess.CalledProcessError, FileNotFoundError):
+                continue
+        self._python_cmd = None
+        return None
+
     def extract_from_binary_xml(self, target_file, adb_mode=False):
-        pattern_pixel = r'<pkg[^>]*n="com\.google\.android\.(?:pixel\.)?setupwizard"[^>]*>.*?<st[^>]*\br="(\d+)"'
-        pattern_galaxy = r'<pkg[^>]*n="com\.sec\.android\.app\.?SecSetupWizard"[^>]*>.*?<st[^>]*\br="(\d+)"'
         script_name = 'ccl_abx.py'
         try:
             if adb_mode:
                 binary_content = self.adb_read_binary_file(target_file)
             elif self.choice == "1":
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    if target_file not in zip_ref.namelist():
-                        self.log(f"파일 {target_file}이(가) ZIP 파일에 존재하지 않습니다.")
-                        return None
-                    with zip_ref.open(target_file) as file:
-                        binary_content = file.read()
+                if target_file not in self.file_set:  # namelist 선형 스캔 대신 캐시된 set 조회
+                    self.log(f"파일 {target_file}이(가) ZIP 파일에 존재하지 않습니다.")
+                    return None
+                with self._get_zipref().open(target_file) as file:
+                    binary_content = file.read()
             elif self.choice == "3":
                 actual_path = self.get_actual_path(target_file) if isinstance(target_file, str) and not os.path.isabs(target_file) else target_file
                 if not actual_path or not os.path.exists(actual_path):
@@ -5298,50 +5594,66 @@ class ResetClassGUI:
                     binary_content = file.read()
             else:
                 return None
-            
-            if not os.path.exists(script_name):
-                self.log(f"경고: {script_name} 파일을 찾을 수 없습니다. appops.xml 처리를 건너뜁니다.")
-                return None
-            
-            with open("temp_binary_file", "wb") as temp_file:
-                temp_file.write(binary_content)
-            
-            python_cmd = "python"
-            try:
-                subprocess.run([python_cmd, "--version"], capture_output=True, check=True)
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                python_cmd = "python3"
+
+            # 1순위: ccl_abx 모듈 직접 호출 (인터프리터 기동/임시 파일 생략)
+            results = None
+            if _ccl_abx is not None:
                 try:
-                    subprocess.run([python_cmd, "--version"], capture_output=True, check=True)
-                except (subprocess.CalledProcessError, FileNotFoundError):
+                    from xml.etree import ElementTree as etree
+                    reader = _ccl_abx.AbxReader(io.BytesIO(binary_content))
+                    doc = reader.read(is_multi_root=True)
+                    results = etree.tostring(doc, encoding="unicode").strip()
+                except Exception as e:
+                    self.log(f"ccl_abx 모듈 호출 실패, 스크립트 실행으로 폴백: {e}")
+                    results = None
+
+            # 2순위: 기존 서브프로세스 방식
+            if not results:
+                if not os.path.exists(script_name):
+                    self.log(f"경고: {script_name} 파일을 찾을 수 없습니다. appops.xml 처리를 건너뜁니다.")
+                    return None
+
+                python_cmd = self._resolve_python_cmd()
+                if not python_cmd:
                     self.log(f"경고: Python을 찾을 수 없습니다. appops.xml 처리를 건너뜁니다.")
                     return None
-            
-            command = [python_cmd, script_name, "temp_binary_file"]
-            result = subprocess.run(command, capture_output=True, text=True, check=False)
-            
-            if result.returncode != 0:
-                self.log(f"ccl_abx.py 실행 실패 (exit code: {result.returncode})")
-                if result.stderr:
-                    self.log(f"오류 메시지: {result.stderr}")
-                if result.stdout:
-                    self.log(f"출력: {result.stdout}")
-                self.last_abx_output = (result.stdout or "") + (("\n" + result.stderr) if result.stderr else "")
-                return None
-            
-            results = result.stdout.strip()
-            if not results:
-                self.log("ccl_abx.py가 출력을 생성하지 않았습니다.")
-                self.last_abx_output = "ccl_abx.py 출력 없음"
-                return None
+
+                # 스크립트가 파일 인자만 받으므로 CWD 대신 시스템 임시 디렉터리
+                # (보통 tmpfs)에 쓰고 실행 후 바로 지운다
+                with tempfile.NamedTemporaryFile(prefix="abx_", delete=False) as temp_file:
+                    temp_file.write(binary_content)
+                    temp_binary_path = temp_file.name
+                try:
+                    command = [python_cmd, script_name, temp_binary_path]
+                    result = subprocess.run(command, capture_output=True, text=True, check=False)
+                finally:
+                    try:
+                        os.remove(temp_binary_path)
+                    except OSError:
+                        pass
+
+                if result.returncode != 0:
+                    self.log(f"ccl_abx.py 실행 실패 (exit code: {result.returncode})")
+                    if result.stderr:
+                        self.log(f"오류 메시지: {result.stderr}")
+                    if result.stdout:
+                        self.log(f"출력: {result.stdout}")
+                    self.last_abx_output = (result.stdout or "") + (("\n" + result.stderr) if result.stderr else "")
+                    return None
+
+                results = result.stdout.strip()
+                if not results:
+                    self.log("ccl_abx.py가 출력을 생성하지 않았습니다.")
+                    self.last_abx_output = "ccl_abx.py 출력 없음"
+                    return None
             self.last_abx_output = results
                 
-            matches = re.findall(pattern_pixel, results, re.DOTALL | re.IGNORECASE)
+            matches = _ABX_PIXEL_RE.findall(results)
             if not matches:
-                matches = re.findall(pattern_galaxy, results, re.DOTALL | re.IGNORECASE)
+                matches = _ABX_GALAXY_RE.findall(results)
             if not matches:
                 # fallback: 모든 r="숫자" 패턴
-                matches = re.findall(r'\br="(\d+)"', results)
+                matches = _R_ATTR_RE.findall(results)
             timestamps = []
             for match in matches:
                 if isinstance(match, tuple):
@@ -5377,27 +5689,46 @@ class ResetClassGUI:
                 result_time = value  # UTC로 간주
                 self.log(f"Datetime (UTC): {value}")
         else:
-            try:
-                epoch_value = int(value)
-                if epoch_value > 253402300799:
-                    epoch_value /= 1000
-                result_time = datetime.utcfromtimestamp(epoch_value)
-                self.log(f"Epoch value: {value} -> UTC: {result_time}")
-            except (ValueError, OverflowError) as e:
-                self.log(f"Invalid or out-of-range epoch value: {value}. Error: {e}")
-
-            # Epoch 파싱이 실패했을 때만 ISO 형식 시도
-            if result_time is None and isinstance(value, str):
-                iso_candidate = value.strip()
-                if iso_candidate.endswith("Z"):
-                    iso_candidate = iso_candidate.replace("Z", "+00:00")
-                # 날짜/시간 형식 가능성이 있는 문자열만 시도
-                if any(ch in iso_candidate for ch in ("-", "T", ":", "+")):
-                    try:
-                        result_time = datetime.fromisoformat(iso_candidate)
-                        self.log(f"UTC timestamp: {iso_candidate} -> UTC: {result_time}")
-                    except ValueError as e2:
-                        self.log(f"Invalid UTC timestamp: {iso_candidate}. Error: {e2}")
+            # 같은 값이 반복 입력되는 경우(초 단위로 묶인 이벤트 등) 변환 결과 캐시
+            cache_key = value if isinstance(value, (int, float, str)) else None
+            if cache_key is not None and cache_key in self._ts_cache:
+                result_time = self._ts_cache[cache_key]
+                self.log(f"Timestamp (cached): {value} -> UTC: {result_time}")
+            else:
+                try:
+                    epoch_value = int(value)
+                    if epoch_value > 253402300799:
+                        epoch_value /= 1000
+                    result_time = datetime.utcfromtimestamp(epoch_value)
+                    self.log(f"Epoch value: {value} -> UTC: {result_time}")
+                except (ValueError, OverflowError) as e:
+                    self.log(f"Invalid or out-of-range epoch value: {value}. Error: {e}")
+
+                # Epoch 파싱이 실패했을 때만 ISO 형식 시도
+                if result_time is None and isinstance(value, str):
+                    iso_candidate = value.strip()
+                    # 흔한 'YYYY-MM-DDTHH:MM:SSZ' 고정폭 형태는 fromisoformat 없이 슬라이스로 구성
+                    if len(iso_candidate) == 20 and iso_candidate[10] in ('T', ' ') and iso_candidate[-1] == 'Z':
+                        try:
+                            result_time = _fast_iso(iso_candidate)
+                            self.log(f"UTC timestamp: {iso_candidate} -> UTC: {result_time}")
+                        except ValueError:
+                            result_time = None
+                if result_time is None and isinstance(value, str):
+                    if iso_candidate.endswith("Z"):
+                        iso_candidate = iso_candidate.replace("Z", "+00:00")
+                    # 날짜/시간 형식 가능성이 있는 문자열만 시도
+                    if any(ch in iso_candidate for ch in ("-", "T", ":", "+")):
+                        try:
+                            result_time = _parse_iso(iso_candidate)
+                            self.log(f"UTC timestamp: {iso_candidate} -> UTC: {result_time}")
+                        except ValueError as e2:
+                            self.log(f"Invalid UTC timestamp: {iso_candidate}. Error: {e2}")
+
+                if cache_key is not None and result_time is not None:
+                    if len(self._ts_cache) >= 1024:
+                        self._ts_cache.clear()
+                    self._ts_cache[cache_key] = result_time
 
         # GUI에 데이터 추가
         if result_time and artifact_id and self.gui_instance:
@@ -5422,24 +5753,54 @@ class ResetClassGUI:
         return result_time
     
     def collect_folder_files(self, folder_path):
-        """폴더 내 모든 파일의 logical 경로 수집"""
+        """폴더 내 모든 파일의 logical 경로 수집 (stat 정보도 함께 캐시)
+
+        os.walk 대신 os.scandir 재귀를 사용해 엔트리별 추가 stat 시스템콜을
+        줄이고, DirEntry가 들고 있는 stat 정보를 그대로 캐시한다.
+        """
         file_list = []
-        for root, dirs, files in os.walk(folder_path):
-            for file in files:
-                full_path = os.path.join(root, file)
-                logical_path = os.path.relpath(full_path, folder_path)
-                logical_path = logical_path.replace('\\', '/')
-                file_list.append(logical_path)
+        stat_map = {}
+        base_len = len(folder_path.rstrip("/\\")) + 1
+
+        # 재귀 대신 deque 순회: 깊은 덤프 트리에서 재귀 한도/프레임 비용 제거
+        pending = deque([folder_path])
+        while pending:
+            dir_path = pending.popleft()
+            try:
+                with os.scandir(dir_path) as it:
+                    for entry in it:
+                        try:
+                            if entry.is_dir(follow_symlinks=False):
+                                pending.append(entry.path)
+                            elif entry.is_file(follow_symlinks=False):
+                                logical_path = entry.path[base_len:].replace('\\', '/')
+                                file_list.append(logical_path)
+                                stat_map[logical_path] = entry.stat(follow_symlinks=False)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+
+        self._folder_stat_map = stat_map
+        # 순회하는 김에 user id도 함께 수집 (get_user_path에서 재스캔 방지)
+        self._user_ids = self._collect_user_ids(file_list)
         return file_list
 
     def get_user_path(self):
+        # file_list 전체(수십만 항목일 수 있음)를 다시 훑지 않도록 첫 결과 캐시
+        if self._user_path_cache is not _UNSET:
+            return self._user_path_cache
+        user_id = self._get_user_path_uncached()
+        self._user_path_cache = user_id
+        return user_id
+
+    def _get_user_path_uncached(self):
         if self.choice == "1":
-            user_ids = set()
-            for file in self.file_list:
-                if file.startswith("Dump/data/user/"):
-                    parts = file.split('/')
-                    if len(parts) > 3:
-                        user_ids.add(parts[3])
+            # file_list 구성 시 수집해 둔 집합 사용 (없으면 한 번만 스캔)
+            user_ids = self._user_ids
+            if user_ids is None:
+                user_ids = self._collect_user_ids(self.file_list)
+                self._user_ids = user_ids
             if user_ids:
                 self.log(f"추출된 USER 값: {user_ids}")
                 return list(user_ids)[-1]
@@ -5447,14 +5808,10 @@ class ResetClassGUI:
                 self.log("ZIP 파일에서 사용자 정보를 찾을 수 없습니다.")
                 return None
         elif self.choice == "3":
-            user_ids = set()
-            for file in self.file_list:
-                if file.startswith("Dump/data/user/") or file.startswith("data/user/"):
-                    parts = file.split('/')
-                    if "user" in parts:
-                        user_idx = parts.index("user")
-                        if user_idx + 1 < len(parts):
-                            user_ids.add(parts[user_idx + 1])
+            user_ids = self._user_ids
+            if user_ids is None:
+                user_ids = self._collect_user_ids(self.file_list)
+                self._user_ids = user_ids
             if user_ids:
                 self.log(f"추출된 USER 값: {user_ids}")
                 return list(user_ids)[-1]
@@ -5476,28 +5833,11 @@ class ResetClassGUI:
     # ----------------- ADB 전용 헬퍼 함수 -----------------
     def find_adb_path(self):
         """ADB 실행 파일 경로 찾기"""
-        # 먼저 PATH에서 adb 찾기 시도
-        try:
-            if os.name == 'nt':  # Windows
-                result = subprocess.run(["where", "adb"], 
-                                      stdout=subprocess.PIPE, 
-                                      stderr=subprocess.PIPE, 
-                                      text=True, 
-                                      timeout=3)
-            else:  # Linux/Mac
-                result = subprocess.run(["which", "adb"], 
-                                      stdout=subprocess.PIPE, 
-                                      stderr=subprocess.PIPE, 
-                                      text=True, 
-                                      timeout=3)
-            
-            if result.returncode == 0 and result.stdout.strip():
-                adb_path = result.stdout.strip().split('\n')[0]
-                if os.path.exists(adb_path):
-                    return adb_path
-        except Exception:
-            pass
-        
+        # 먼저 PATH에서 adb 찾기 (where/which 서브프로세스 대신 shutil.which)
+        adb_path = shutil.which("adb")
+        if adb_path:
+            return adb_path
+
         # 일반적인 Android SDK 경로 확인 (Windows)
         if os.name == 'nt':
             common_paths = [
@@ -5525,22 +5865,28 @@ class ResetClassGUI:
         return None
     
     def get_adb_command(self):
-        """ADB 명령어 반환 (경로 포함)"""
-        adb_path = self.find_adb_path()
-        if adb_path:
-            return adb_path
-        # 경로를 찾지 못하면 'adb'만 반환 (PATH에 있을 수 있음)
-        return "adb"
-    
+        """ADB 명령어 반환 (경로 포함)
+
+        find_adb_path는 where/which 서브프로세스와 여러 후보 경로 stat을
+        수행하므로 첫 호출 결과를 캐시한다 (ADB 헬퍼마다 재탐색 방지).
+        """
+        if self._adb_cmd is None:
+            adb_path = self.find_adb_path()
+            # 경로를 찾지 못하면 'adb'만 사용 (PATH에 있을 수 있음)
+            self._adb_cmd = adb_path if adb_path else "adb"
+        return self._adb_cmd
+
     def get_adb_args(self, *args):
         """ADB 명령 인자 생성 (여러 디바이스가 있을 때 -s 옵션 추가)"""
-        adb_cmd = self.get_adb_command()
-        cmd_list = [adb_cmd]
-        # 여러 디바이스가 있을 때 디바이스 ID 지정
-        if self.adb_device_id:
-            cmd_list.extend(["-s", self.adb_device_id])
-        cmd_list.extend(args)
-        return cmd_list
+        # 고정 접두부([adb, -s, id])는 디바이스 ID가 정해진 뒤 재사용
+        prefix = self._adb_args_prefix
+        if prefix is None or prefix[0] != (self.adb_device_id or ""):
+            adb_cmd = self.get_adb_command()
+            cmd_list = [adb_cmd]
+            if self.adb_device_id:
+                cmd_list.extend(["-s", self.adb_device_id])
+            self._adb_args_prefix = prefix = (self.adb_device_id or "", cmd_list)
+        return list(prefix[1]) + list(args)
     
     def check_adb_connection(self):
         """ADB 연결 상태 확인"""
@@ -5620,72 +5966,189 @@ class ResetClassGUI:
             self.log(f"ADB 연결 확인 중 오류: {e}")
             return False
     
+    _ADB_RC_MARKER = "__ADB_RC__"
+
+    def _adb_exec(self, cmd, timeout=30):
+        """영속 adb shell 세션에서 su 명령 실행 → (종료코드, 출력 문자열)
+
+        호출마다 `adb shell su -c ...` 프로세스를 새로 띄우면 기동 비용이
+        수십~수백 ms씩 쌓인다 (Deep Search는 파일당 여러 번 호출).
+        하나의 shell을 계속 열어 두고 명령 끝에 센티널 라인을 붙여
+        출력 경계와 종료 코드를 구분한다. 세션이 죽으면 다음 호출에서
+        자동으로 재기동한다.
+        """
+        with self._adb_shell_lock:
+            try:
+                if self._adb_shell is None or self._adb_shell.poll() is not None:
+                    self._adb_shell = subprocess.Popen(
+                        self.get_adb_args("shell"),
+                        stdin=subprocess.PIPE,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.DEVNULL,
+                    )
+                shell = self._adb_shell
+                marker = self._ADB_RC_MARKER
+                shell.stdin.write(f"su -c '{cmd}' 2>/dev/null; echo {marker}$?\n".encode())
+                shell.stdin.flush()
+
+                # readline이 무한 대기하지 않도록 타임아웃 시 세션을 강제 종료
+                watchdog = threading.Timer(timeout, shell.kill)
+                watchdog.start()
+                out_parts = []
+                rc = None
+                try:
+                    for raw in shell.stdout:
+                        line = raw.decode('utf-8', errors='ignore').replace('\r\n', '\n')
+                        idx = line.find(marker)
+                        if idx != -1:
+                            if idx:
+                                out_parts.append(line[:idx])
+                            try:
+                                rc = int(line[idx + len(marker):].strip())
+                            except ValueError:
+                                rc = -1
+                            break
+                        out_parts.append(line)
+                finally:
+                    watchdog.cancel()
+                if rc is None:
+                    # 센티널 전에 EOF → 세션 사망(타임아웃 포함), 다음 호출에서 재기동
+                    self._adb_shell = None
+                    return -1, "".join(out_parts)
+                return rc, "".join(out_parts)
+            except Exception as e:
+                self.log(f"ADB 셸 명령 실행 오류 ({cmd}): {e}")
+                self._close_adb_shell()
+                return -1, ""
+
+    def _close_adb_shell(self):
+        """영속 adb shell 세션 종료"""
+        shell = self._adb_shell
+        self._adb_shell = None
+        if shell is not None:
+            try:
+                shell.kill()
+                shell.wait(timeout=5)
+            except Exception:
+                pass
+
     def check_root_access(self):
         """루트 권한 확인"""
-        adb_cmd = self.get_adb_command()
         try:
             # su 명령으로 id 확인 (루트면 uid=0)
-            result = subprocess.run([adb_cmd, "shell", "su", "-c", "id"],
-                                  stdout=subprocess.PIPE,
-                                  stderr=subprocess.PIPE,
-                                  text=True,
-                                  timeout=5)
-            
-            if result.returncode == 0:
+            rc, output = self._adb_exec("id", timeout=5)
+            if rc == 0:
                 # uid=0이면 루트 권한
-                if "uid=0" in result.stdout:
+                if "uid=0" in output:
                     self.log("루트 권한 확인됨.")
                     return True
                 else:
-                    self.log(f"루트 권한 없음. 현재 사용자: {result.stdout.strip()}")
+                    self.log(f"루트 권한 없음. 현재 사용자: {output.strip()}")
                     return False
             else:
                 # su 명령 실패 (루트 권한 없음 또는 su가 거부됨)
-                error_msg = result.stderr.strip() if result.stderr else "알 수 없는 오류"
-                if "not found" in error_msg.lower() or "permission denied" in error_msg.lower():
-                    self.log("루트 권한 없음: su 명령을 실행할 수 없습니다.")
-                else:
-                    self.log(f"루트 권한 확인 실패: {error_msg}")
+                self.log("루트 권한 확인 실패: su 명령을 실행할 수 없거나 거부되었습니다.")
                 return False
-        except (subprocess.TimeoutExpired, Exception) as e:
+        except Exception as e:
             self.log(f"루트 권한 확인 중 오류: {e}")
             return False
-    
+
+    def _adb_exists_many(self, paths):
+        """여러 경로의 존재 여부를 한 번의 ADB 왕복으로 확인하여 캐시
+
+        경로당 round-trip 대신 ls -d 한 번으로 확인한다. 결과는
+        adb_file_exists가 참조하는 캐시에 들어간다.
+        """
+        to_check = [p for p in paths if p not in self._adb_ls_cache]
+        if not to_check:
+            return
+        try:
+            joined = " ".join(to_check)
+            rc, output = self._adb_exec(f"ls -d {joined}", timeout=10)
+            found = {line.strip() for line in output.splitlines() if line.strip()}
+            for p in to_check:
+                self._adb_ls_cache[p] = p in found
+        except Exception as e:
+            self.log(f"일괄 파일 존재 확인 중 오류: {e}")
+
     def adb_file_exists(self, file_path):
         """ADB를 통해 파일 존재 여부 확인 (루트 권한 필요)"""
-        adb_cmd = self.get_adb_command()
+        cached = self._adb_ls_cache.get(file_path)
+        if cached is not None:
+            return cached
         try:
-            result = subprocess.run([adb_cmd, "shell", "su", "-c", f"test -f {file_path} && echo 'exists'"],
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
-            if result.returncode == 0 and "exists" in result.stdout:
+            rc, output = self._adb_exec(f"test -f {file_path} && echo exists", timeout=10)
+            if rc == 0 and "exists" in output:
+                self._adb_ls_cache[file_path] = True
                 return True
             # 대체 방법: ls 명령 사용
-            result = subprocess.run([adb_cmd, "shell", "su", "-c", f"ls {file_path}"],
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=10)
-            if result.returncode == 0 and "No such file" not in result.stderr:
+            rc, output = self._adb_exec(f"ls {file_path}", timeout=10)
+            if rc == 0:
+                self._adb_ls_cache[file_path] = True
                 return True
-            return False
-        except subprocess.TimeoutExpired:
-            self.log(f"파일 존재 확인 시간 초과: {file_path}")
+            self._adb_ls_cache[file_path] = False
             return False
         except Exception as e:
             self.log(f"파일 존재 확인 중 오류 ({file_path}): {e}")
             return False
 
-    def adb_read_file(self, file_path, decode='utf-8'):
-        """ADB를 통해 파일 읽기 (루트 권한 필요)"""
+    def _adb_try_read(self, file_path):
+        """ADB exec-out cat으로 존재 확인과 읽기를 한 번의 왕복으로 처리
+
+        파일이 없으면 cat이 비정상 종료하거나 출력이 비므로 None을 반환한다.
+        test -f → cat 의 두 번 왕복을 한 번으로 줄인다.
+        """
         adb_cmd = self.get_adb_command()
         try:
-            result = subprocess.run([adb_cmd, "shell", "su", "-c", f"cat {file_path}"],
-                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30)
-            if result.stderr and result.stderr.strip():
-                # stderr에 실제 오류가 있는 경우만 로그
-                if "Permission denied" in result.stderr or "No such file" not in result.stderr:
-                    self.log(f"파일 읽기 경고 ({file_path}): {result.stderr.strip()}")
-            return result.stdout
+            proc = subprocess.Popen([adb_cmd, "exec-out", "su", "-c", f"cat {file_path}"],
+                                    stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+            # 대용량 로그도 큰 청크 단위로 읽도록 버퍼링. read()가 멈춘
+            # 장치에서 무한 대기하지 않도록 타임아웃 시 프로세스를 강제 종료
+            # (_adb_exec의 watchdog 패턴과 동일).
+            timed_out = threading.Event()
+
+            def _kill_on_timeout():
+                timed_out.set()
+                proc.kill()
+
+            watchdog = threading.Timer(30, _kill_on_timeout)
+            watchdog.start()
+            try:
+                reader = io.BufferedReader(proc.stdout, buffer_size=131072)
+                data = reader.read()
+                proc.stderr.read()
+            finally:
+                watchdog.cancel()
+            proc.wait(timeout=30)
+            if timed_out.is_set():
+                # 강제 종료된 읽기는 파일 부재와 구분되므로 캐시하지 않는다
+                self.log(f"파일 읽기 시간 초과: {file_path}")
+                return None
+            if proc.returncode != 0 or not data:
+                self._adb_ls_cache[file_path] = False
+                return None
+            self._adb_ls_cache[file_path] = True
+            return data
         except subprocess.TimeoutExpired:
             self.log(f"파일 읽기 시간 초과: {file_path}")
-            return ""
+            return None
+        except Exception as e:
+            self.log(f"파일 읽기 오류 ({file_path}): {e}")
+            return None
+
+    def adb_read_file(self, file_path, decode='utf-8'):
+        """ADB를 통해 파일 읽기 (루트 권한 필요)
+
+        cat의 종료 코드가 존재 확인을 겸하므로 결과를 존재 캐시에도
+        반영한다 (별도 test -f 왕복 불필요).
+        """
+        try:
+            rc, output = self._adb_exec(f"cat {file_path}", timeout=30)
+            if rc != 0 and not output:
+                self._adb_ls_cache.setdefault(file_path, False)
+                return ""
+            self._adb_ls_cache[file_path] = True
+            return output
         except Exception as e:
             self.log(f"파일 읽기 오류 ({file_path}): {e}")
             return ""
@@ -5727,20 +6190,84 @@ class ResetClassGUI:
             return None
 
     def adb_get_mod_time(self, file_path):
-        adb_cmd = self.get_adb_command()
-        result = subprocess.run([adb_cmd, "shell", "su", "-c", f"stat {file_path}"],
-                                stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
-        if result.stderr:
-            self.log(f"Error stat-ing {file_path}: {result.stderr}")
+        # 전체 stat 출력에서 Modify: 줄을 정규식으로 찾는 대신
+        # epoch 초만 출력받아 정수 변환 한 번으로 끝낸다
+        rc, output = self._adb_exec(f"stat -c %Y {file_path}")
+        if rc != 0:
+            self.log(f"Error stat-ing {file_path}: exit code {rc}")
+            return None
+        try:
+            return datetime.utcfromtimestamp(int(output.strip()))
+        except (ValueError, OverflowError):
+            return None
+
+    def adb_batch_read(self, paths, batch=64):
+        """여러 파일의 (경로, 수정시간, 내용)을 소수의 ADB 왕복으로 읽는 제너레이터
+
+        Deep Search는 파일당 stat 한 번 + cat 한 번, 즉 2×N 왕복을 쓰던
+        구조였다. 한 번의 셸 루프에서 batch개 파일의 mtime과 base64 인코딩
+        내용을 구분자와 함께 내보내고 파이썬 쪽에서 역다중화한다.
+        입력 경로 순서 그대로 (path, mtime|None, bytes|None)을 yield하며,
+        mtime은 _adb_mtime_cache에도 채워 이후 조회가 왕복 없이 끝나게 한다.
+        """
+        for start in range(0, len(paths), batch):
+            chunk = paths[start:start + batch]
+            joined = " ".join(f'"{p}"' for p in chunk)
+            cmd = (
+                f'for f in {joined}; do echo "__REC__$f"; '
+                'stat -c %Y "$f" 2>/dev/null || echo -; '
+                'echo __B__; base64 "$f" 2>/dev/null; echo __E__; done'
+            )
+            rc, output = self._adb_exec(cmd, timeout=120)
+
+            records = {}
+            cur_path = None
+            cur_mtime = None
+            b64_parts = None
+            for line in output.splitlines():
+                if line.startswith("__REC__"):
+                    cur_path = line[len("__REC__"):]
+                    cur_mtime = _UNSET
+                    b64_parts = None
+                elif cur_path is None:
+                    continue
+                elif cur_mtime is _UNSET:
+                    cur_mtime = None
+                    if line.strip() != "-":
+                        try:
+                            cur_mtime = datetime.utcfromtimestamp(int(line.strip()))
+                        except (ValueError, OverflowError):
+                            pass
+                elif line == "__B__":
+                    b64_parts = []
+                elif line == "__E__":
+                    data = None
+                    if b64_parts:
+                        try:
+                            data = base64.b64decode("".join(b64_parts))
+                        except Exception:
+                            data = None
+                    records[cur_path] = (cur_mtime, data)
+                    cur_path = None
+                elif b64_parts is not None:
+                    b64_parts.append(line.strip())
+
+            for p in chunk:
+                mtime, data = records.get(p, (None, None))
+                self._adb_mtime_cache[p] = mtime
+                self._adb_ls_cache[p] = data is not None
+                yield p, mtime, data
+
+    def get_file_mod_time_for_search(self, file_path):
+        """Deep Search용 파일 수정 시간 조회 (모드 공통)"""
+        try:
+            if self.choice == "2":
+                if file_path in self._adb_mtime_cache:
+                    return self._adb_mtime_cache[file_path]
+                return self.adb_get_mod_time(file_path)
+            return self.get_mod_time_from_zip(file_path)
+        except Exception:
             return None
-        for line in result.stdout.splitlines():
-            if "Modify:" in line:
-                match = re.search(r"Modify:\s*(\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2})", line)
-                if match:
-                    date_str = match.group(1)
-                    dt = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    return dt
-        return None
 
     def adb_pull_file(self, remote_path, local_path):
         """ADB를 통해 파일 pull (루트 권한이 필요한 파일의 경우 임시로 복사 후 pull)"""
@@ -5803,11 +6330,12 @@ class ResetClassGUI:
         
         try:
             conn = sqlite3.connect(db_path)
+            _tune_sqlite(conn)
             cursor = conn.cursor()
             cursor.execute(query)
             columns = [description[0] for description in cursor.description]
             results = cursor.fetchall()
-            df = pd.DataFrame(results, columns=columns)
+            df = _apply_wellbing_event_names(pd.DataFrame(results, columns=columns))
             conn.close()
             return df
         except Exception as e:
@@ -5837,6 +6365,7 @@ class ResetClassGUI:
         
         try:
             conn = sqlite3.connect(db_path)
+            _tune_sqlite(conn)
             cursor = conn.cursor()
             cursor.execute("SELECT MIN(date_added) AS earliest_date FROM files;")
             result = cursor.fetchone()
@@ -5846,6 +6375,27 @@ class ResetClassGUI:
             self.log(f"Error in execute_internal_query_local: {e}")
             return None
 
+    def _connect_db_bytes(self, sqlite3, db_content):
+        """DB 바이트를 바로 조회 가능한 연결로 → (연결, 정리할 임시 파일 경로|None)
+
+        SQLite 3.36+(파이썬 3.11+)는 deserialize로 바이트를 디스크에 쓰지
+        않고 :memory: DB에 직접 적재할 수 있다. 미지원 환경에서는 기존처럼
+        임시 파일에 쓰되 NamedTemporaryFile로 고유한 이름을 받아
+        병렬 핸들러 간 충돌을 피한다 (backup 복사 단계는 생략).
+        """
+        conn = sqlite3.connect(":memory:")
+        if hasattr(conn, "deserialize"):
+            try:
+                conn.deserialize(db_content)
+                return conn, None
+            except Exception:
+                pass  # 손상/포맷 문제면 파일 경유로 폴백
+        conn.close()
+        with tempfile.NamedTemporaryFile(prefix="wellbing_", suffix=".db", delete=False) as temp_file:
+            temp_file.write(db_content)
+            temp_db_path = temp_file.name
+        return sqlite3.connect(temp_db_path), temp_db_path
+
     # ----------------- 기존 execute_wellbing_query (ZIP/폴더 모드) -----------------
     def execute_wellbing_query(self, db_file, query):
         try:
@@ -5869,11 +6419,14 @@ class ResetClassGUI:
             self.log(f"SQLite 모듈 로드 중 예상치 못한 오류: {e}")
             return "SQLite 모듈을 사용할 수 없습니다."
         
+        cache_key = (self.choice, db_file, query)
+        if cache_key in self._wellbing_query_cache:
+            return self._wellbing_query_cache[cache_key]
+
         try:
             if self.choice == "1":
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    with zip_ref.open(db_file) as file:
-                        db_content = file.read()
+                with self._get_zipref().open(db_file) as file:
+                    db_content = file.read()
             elif self.choice == "3":
                 actual_path = self.get_actual_path(db_file) if isinstance(db_file, str) and not os.path.isabs(db_file) else db_file
                 if not actual_path or not os.path.exists(actual_path):
@@ -5882,38 +6435,35 @@ class ResetClassGUI:
                     db_content = file.read()
             else:
                 return None
-            
-            with open("temp_db.db", "wb") as temp_file:
-                temp_file.write(db_content)
-            mem_db = sqlite3.connect(":memory:")
-            disk_db = sqlite3.connect("temp_db.db")
-            with disk_db:
-                disk_db.backup(mem_db)
-            cursor = mem_db.cursor()
-            if query is None:
-                cursor.execute("SELECT MIN(date_added) AS earliest_date FROM files;")
-                result = cursor.fetchone()
-                mem_db.close()
-                disk_db.close()
-                return result[0] if result else None
-            if "6" in self.artifact_choices or "0" in self.artifact_choices:
-                cursor.execute(query)
-                columns = [description[0] for description in cursor.description]
-                results = cursor.fetchall()
-                df = pd.DataFrame(results, columns=columns)
-                try:
-                    filtered_df = df[df["package_name"].isin(["com.google.android.setupwizard", "android"])]
-                except Exception as e:
-                    filtered_df = df[df["name"].isin(["setupwizard", "android"])]
-                mem_db.close()
-                disk_db.close()
-                return filtered_df
-            else:
-                cursor.execute("SELECT MIN(date_added) AS earliest_date FROM files;")
-                result = cursor.fetchone()
+
+            mem_db, temp_db_path = self._connect_db_bytes(sqlite3, db_content)
+            try:
+                _tune_sqlite(mem_db)
+                cursor = mem_db.cursor()
+                if query is None:
+                    cursor.execute("SELECT MIN(date_added) AS earliest_date FROM files;")
+                    result = cursor.fetchone()
+                    result = result[0] if result else None
+                elif "6" in self.artifact_choices or "0" in self.artifact_choices:
+                    # 패키지 필터는 쿼리 상수의 WHERE 절에서 처리 (불필요한 행을
+                    # DataFrame으로 올렸다가 버리는 비용 제거)
+                    cursor.execute(query)
+                    columns = [description[0] for description in cursor.description]
+                    results = cursor.fetchall()
+                    result = _apply_wellbing_event_names(pd.DataFrame(results, columns=columns))
+                else:
+                    cursor.execute("SELECT MIN(date_added) AS earliest_date FROM files;")
+                    row = cursor.fetchone()
+                    result = row[0]
+                self._wellbing_query_cache[cache_key] = result
+                return result
+            finally:
                 mem_db.close()
-                disk_db.close()
-                return result[0]
+                if temp_db_path:
+                    try:
+                        os.remove(temp_db_path)
+                    except OSError:
+                        pass
         except sqlite3.Error as e:
             self.log(f"SQLite 오류 발생: {e}")
             return "wellbeing 데이터가 기록되지 않았습니다."
@@ -5982,55 +6532,201 @@ class ResetClassGUI:
         else:
             files_to_search = []
         
-        # 바이너리 파일 필터링
-        text_files = []
-        skip_extensions = ['.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mp3', '.apk', '.so', '.dex', '.bin', '.dat', '.zip', '.rar']
-        for file_path in files_to_search:
-            if not any(file_path.lower().endswith(ext) for ext in skip_extensions):
-                text_files.append(file_path)
-        
+        # 바이너리 파일 필터링 (endswith는 튜플 인자로 한 번에 C 레벨에서 검사)
+        text_files = [
+            file_path for file_path in files_to_search
+            if not file_path.lower().endswith(_DEEP_SEARCH_SKIP_EXTS)
+        ]
+
+        # 이미 캐시된 메타데이터(zip central directory / scandir stat)로
+        # 거대 파일을 열기 전에 제외 — 수백 MB급 바이너리는 타임스탬프
+        # 로그가 아니므로 읽기/스캔 비용만 낭비한다
+        if self.choice == "1":
+            info_map = self.zip_info_map
+            text_files = [
+                f for f in text_files
+                if (info_map.get(f) is None or
+                    info_map[f].file_size <= _DEEP_SEARCH_MAX_SIZE)
+            ]
+        elif self.choice == "3":
+            stat_map = self._folder_stat_map
+            text_files = [
+                f for f in text_files
+                if (stat_map.get(f) is None or
+                    stat_map[f].st_size <= _DEEP_SEARCH_MAX_SIZE)
+            ]
+
         total_files = len(text_files)
         self.log(f"검색할 파일 수: {total_files}")
         self.log(f"검색할 시간 패턴 수: {len(search_patterns)}")
-        
+
+        # 파일 루프 밖에서 패턴을 한 번만 준비
+        # (파일 수 × 패턴 수만큼 str()/lower()/struct.pack을 반복하지 않도록)
+        for search_info in search_patterns:
+            search_info['prepared'] = [
+                (name, str(val), str(val).lower())
+                for name, val in search_info['patterns'].items() if val
+            ]
+            search_info['bin_patterns'] = _build_binary_patterns(search_info['time_info']['time'])
+
+        # 시간 항목 × 패턴마다 content를 따로 스캔하는 대신,
+        # 전체 리터럴을 한 번의 선형 스캔으로 찾는 통합 스캐너 준비.
+        # 매칭은 전부 바이트 수준으로 수행한다: 파일을 str로 디코딩하면
+        # 파일 크기만큼의 사본이 생기고, errors='ignore'가 바이트를 버려
+        # 경계가 어긋난 거짓 매치/누락이 생길 수 있다.
+        text_keys = sorted({vl for si in search_patterns for _, _, vl in si['prepared']},
+                           key=len, reverse=True)
+        bin_keys = sorted({bv for si in search_patterns for bv in si['bin_patterns'].values()},
+                          key=len, reverse=True)
+        # 리터럴 교대 패턴이라 re2의 이점이 없고, 표준 re는 mmap 버퍼도
+        # 직접 스캔할 수 있으므로 두 스캐너 모두 표준 re로 컴파일
+        bin_scan_re = re.compile(b"|".join(re.escape(k) for k in bin_keys)) if bin_keys else None
+        text_keys_b = [k.encode('utf-8') for k in text_keys]
+        text_scan_re_b = re.compile(b"|".join(re.escape(k) for k in text_keys_b)) if text_keys_b else None
+        chunk_overlap = max([len(k) for k in bin_keys] + [len(k) for k in text_keys_b] + [1]) - 1
+        # 패턴이 전부 숫자/구분자뿐이면(대부분의 epoch·날짜 패턴) 대소문자가
+        # 무의미하므로 파일마다 lower() 사본을 만들 필요가 없다
+        needs_lower = any(c.isalpha() for key in text_keys for c in key)
+
+        def scan_chunks(chunks):
+            """전체 버퍼를 만들지 않고 겹침 청크 단위로 스캔
+
+            경계에 걸린 매치를 놓치지 않도록 직전 청크의 꼬리(최장 패턴 - 1)를
+            이어 붙인다. 작은 파일은 버퍼(또는 mmap) 하나짜리 시퀀스를 그대로
+            넘기면 된다. 반환값은 (매치된 텍스트 패턴 집합, 바이너리 패턴별
+            전역 첫 오프셋).
+            """
+            matched = set()
+            offsets = {}
+            tail = b""
+            pos = 0
+            for chunk in chunks:
+                # 첫 청크가 mmap이면 복사 없이 그대로 스캔 (bytes + mmap 연결 불가)
+                buf = (tail + chunk) if tail else chunk
+                base = pos - len(tail)
+                if needs_lower:
+                    hay = (buf if isinstance(buf, bytes) else bytes(buf)).lower()
+                else:
+                    hay = buf
+                if text_scan_re_b is not None:
+                    for m in text_scan_re_b.finditer(hay):
+                        matched.add(m.group(0).decode('utf-8', 'ignore'))
+                if bin_scan_re is not None:
+                    for m in bin_scan_re.finditer(buf):
+                        offsets.setdefault(m.group(0), base + m.start())
+                pos += len(chunk)
+                tail = bytes(buf[-chunk_overlap:]) if chunk_overlap else b""
+            # 비중첩 교대 스캔이라 긴 매치에 포함된 짧은 패턴이 가려질 수 있어 보정
+            for key in text_keys:
+                if key not in matched and any(key in m for m in matched):
+                    matched.add(key)
+            for key in bin_keys:
+                if key in offsets:
+                    continue
+                for mk, off in list(offsets.items()):
+                    inner = mk.find(key)
+                    if inner != -1:
+                        offsets[key] = off + inner
+                        break
+            return matched, offsets
+
         match_count = 0
         processed_count = 0
-        
-        # 각 파일에서 검색
-        for idx, file_path in enumerate(text_files):
+        counter_lock = threading.Lock()  # 병렬 스캔 시 카운터 보호
+
+        def bump_progress():
+            nonlocal processed_count
+            with counter_lock:
+                processed_count += 1
+                done = processed_count
+            # 진행률 업데이트 (10개마다 또는 마지막 파일)
+            if progress_callback and (done % 10 == 0 or done == total_files):
+                progress_callback.emit(done, total_files)
+
+        def bump_match():
+            nonlocal match_count
+            with counter_lock:
+                match_count += 1
+
+        def scan_one(file_path, adb_raw=_UNSET):
+            """파일 하나 읽기 + 매칭 (스레드 풀 워커에서도 호출됨)"""
+            file_obj = mm_obj = None
+            bumped = False
+            # 매칭 로그는 모아서 파일당 한 번만 내보낸다 (워커 스레드에서는
+            # 로그가 시그널로 큐잉되므로 매칭마다 emit하면 트래픽만 는다)
+            match_logs = []
             try:
-                # 파일 읽기
-                if self.choice == "1":
-                    content = self.read_file_for_search(file_path)
-                    raw_bytes = self.read_file_bytes(file_path)
+                # 로컬 소스는 캐시된 stat만으로 선별: mtime이 모든 대상 시각의
+                # 오차 범위 밖이고 크기도 큰 파일은 읽기/스캔 자체를 생략한다
+                # (작은 파일은 stat과 무관하게 기존대로 내용까지 스캔)
+                file_mtime = None
+                if adb_raw is _UNSET and self.choice in ("1", "3"):
+                    file_mtime = self.get_file_mod_time_for_search(file_path)
+                    if self.choice == "1":
+                        info0 = self.zip_info_map.get(file_path)
+                        size = info0.file_size if info0 is not None else 0
+                    else:
+                        st = self._folder_stat_map.get(file_path)
+                        size = st.st_size if st is not None else 0
+                    if (file_mtime is not None and size > _MTIME_SKIP_MIN_SIZE and
+                            not any(abs((file_mtime - si['time_info']['time']).total_seconds()) <= time_tolerance_seconds
+                                    for si in search_patterns)):
+                        bumped = True
+                        bump_progress()
+                        return
+
+                # 파일 읽기: str 디코딩 없이 바이트 그대로 스캔
+                # (대용량 파일은 전체 버퍼 대신 청크 스캔)
+                raw_bytes = None
+                chunk_result = None
+                if adb_raw is not _UNSET:
+                    raw_bytes = adb_raw or b""
+                elif self.choice == "1":
+                    info = self.zip_info_map.get(file_path)
+                    if info is not None and info.file_size > _LARGE_SCAN_THRESHOLD:
+                        def _zip_chunks():
+                            with self._get_zipref().open(file_path) as f:
+                                while True:
+                                    c = f.read(_SCAN_CHUNK)
+                                    if not c:
+                                        break
+                                    yield c
+                        chunk_result = scan_chunks(_zip_chunks())
+                    else:
+                        raw_bytes = self.read_file_bytes(file_path) or b""
                 elif self.choice == "3":
-                    content = self.read_file_for_search(file_path)
-                    raw_bytes = self.read_file_bytes(file_path)
-                elif self.choice == "2":
-                    content = self.adb_read_file_for_search(file_path)
-                    raw_bytes = self.adb_read_file_bytes(file_path)
-                else:
-                    content = None
-                    raw_bytes = b""
-                
-                processed_count += 1
-                
-                # 진행률 업데이트 (10개마다 또는 마지막 파일)
-                if progress_callback and (processed_count % 10 == 0 or processed_count == total_files):
-                    progress_callback.emit(processed_count, total_files)
-                
-                if not content:
-                    continue
-                content_lower = content.lower()
+                    # 실제 디스크 파일은 mmap으로 열어 복사 없이 스캔
+                    actual_path = self.get_actual_path(file_path) if not os.path.isabs(file_path) else file_path
+                    if actual_path and os.path.exists(actual_path):
+                        file_obj, mm_obj = self._open_mmap(actual_path)
+                    if mm_obj is not None and len(mm_obj) > _LARGE_SCAN_THRESHOLD:
+                        def _mm_chunks():
+                            for off in range(0, len(mm_obj), _SCAN_CHUNK):
+                                yield mm_obj[off:off + _SCAN_CHUNK]
+                        chunk_result = scan_chunks(_mm_chunks())
+                    else:
+                        raw_bytes = mm_obj if mm_obj is not None else b""
+
+                bumped = True
+                bump_progress()
 
-                # 파일 수정 시간 기반 매칭
-                file_mtime = self.get_file_mod_time_for_search(file_path)
+                # date_only 문맥 확인용 원본 버퍼 (청크 경로는 전체 버퍼가 없음)
+                hay_small = None
+                if chunk_result is None:
+                    if not raw_bytes:
+                        return
+                    chunk_result = scan_chunks((raw_bytes,))
+                    hay_small = raw_bytes
+
+                # 파일 수정 시간 기반 매칭 (선별 단계에서 조회한 값 재사용)
+                if file_mtime is None:
+                    file_mtime = self.get_file_mod_time_for_search(file_path)
                 if file_mtime:
                     for search_info in search_patterns:
                         time_dt = search_info['time_info']['time']
                         diff_sec = abs((file_mtime - time_dt).total_seconds())
                         if diff_sec <= time_tolerance_seconds:
-                            match_count += 1
+                            bump_match()
                             diff_min = diff_sec / 60
                             if diff_sec < 60:
                                 display_value = f"{file_mtime.strftime('%Y-%m-%d %H:%M:%S')} (차이: {diff_sec:.0f}초)"
@@ -6043,22 +6739,22 @@ class ResetClassGUI:
                                 display_value
                             )
                 
-                # 각 시간 패턴으로 검색
+                # 각 시간 패턴으로 검색 (통합 스캐너 결과 재사용)
+                matched_text, bin_offsets = chunk_result
                 for search_info in search_patterns:
-                    for pattern_name, pattern_value in search_info['patterns'].items():
-                        if not pattern_value:
-                            continue
-                        pattern_value_str = str(pattern_value)
-                        pattern_value_lower = pattern_value_str.lower()
-                        if pattern_value_lower in content_lower:
+                    for pattern_name, pattern_value_str, pattern_value_lower in search_info['prepared']:
+                        if pattern_value_lower in matched_text:
                             # 날짜만 매칭인데 실제로 시간 정보가 붙어 있는 경우는 날짜-only 결과를 건너뜀
-                            if pattern_name == 'date_only':
-                                idx = content_lower.find(pattern_value_lower)
+                            # (청크 스캔 경로는 전체 버퍼가 없어 문맥 확인 생략)
+                            if pattern_name == 'date_only' and hay_small is not None:
+                                idx = hay_small.find(pattern_value_lower.encode('utf-8'))
                                 if idx != -1:
-                                    context = content_lower[max(0, idx - 3):idx + 20]
-                                    if re.search(r"\d{2}:\d{2}:\d{2}", context):
+                                    context = hay_small[max(0, idx - 3):idx + 20].decode('utf-8', 'ignore')
+                                    # 대부분의 창에는 ':'조차 없으므로 C 레벨
+                                    # 문자 검사로 정규식 호출을 먼저 걸러낸다
+                                    if ':' in context and _HMS_RE.search(context):
                                         continue
-                            match_count += 1
+                            bump_match()
                             
                             # 매칭된 형식에 따라 시간 정보 유무 표시
                             display_value = pattern_value_str
@@ -6075,15 +6771,14 @@ class ResetClassGUI:
                                 pattern_name,
                                 display_value
                             )
-                            self.log(f"매칭 발견: {file_path} - {pattern_name}: {display_value}")
+                            match_logs.append(f"매칭 발견: {file_path} - {pattern_name}: {display_value}")
 
                     # HEX/바이너리 패턴 검색
-                    if raw_bytes:
-                        bin_patterns = self.build_binary_patterns(search_info['time_info']['time'])
-                        for bin_name, bin_value in bin_patterns.items():
-                            offset = raw_bytes.find(bin_value)
+                    if bin_offsets:
+                        for bin_name, bin_value in search_info['bin_patterns'].items():
+                            offset = bin_offsets.get(bin_value, -1)
                             if offset != -1:
-                                match_count += 1
+                                bump_match()
                                 hex_str = " ".join(f"{b:02X}" for b in bin_value)
                                 display_value = f"{bin_name} @0x{offset:X}: {hex_str}"
                                 result_callback.emit(
@@ -6092,15 +6787,33 @@ class ResetClassGUI:
                                     f"hex_{bin_name}",
                                     display_value
                                 )
-                                self.log(f"매칭 발견(HEX): {file_path} - {bin_name} @0x{offset:X}")
+                                match_logs.append(f"매칭 발견(HEX): {file_path} - {bin_name} @0x{offset:X}")
             
-            except Exception as e:
+            except Exception:
                 # 파일 읽기 실패는 무시하고 계속
-                processed_count += 1
-                if progress_callback and (processed_count % 10 == 0 or processed_count == total_files):
-                    progress_callback.emit(processed_count, total_files)
-                continue
-        
+                if not bumped:
+                    bump_progress()
+            finally:
+                if mm_obj is not None:
+                    mm_obj.close()
+                if file_obj is not None:
+                    file_obj.close()
+                if match_logs:
+                    self.log_many(match_logs)
+
+        # 파일 스캔은 서로 독립이므로 로컬 소스(ZIP/폴더)는 스레드 풀로 병렬화
+        # (ADB는 단일 셸의 일괄 읽기 스트림을 순서대로 소비해야 하므로 순차 유지)
+        if self.choice == "2":
+            for file_path, _, adb_raw in self.adb_batch_read(text_files):
+                scan_one(file_path, adb_raw)
+        elif total_files > 1:
+            with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as executor:
+                for _ in executor.map(scan_one, text_files):
+                    pass
+        else:
+            for file_path in text_files:
+                scan_one(file_path)
+
         # 최종 진행률 업데이트
         if progress_callback:
             progress_callback.emit(total_files, total_files)
@@ -6108,31 +6821,53 @@ class ResetClassGUI:
         self.log(f"Deep Search completed. Total {match_count} matches found")
         self.log("=" * 60)
     
+    def _open_mmap(self, actual_path):
+        """파일을 읽기 전용 mmap으로 열기 → (파일 객체, mmap) 또는 (None, None)
+
+        전체 read()와 달리 커널 페이지 캐시를 그대로 쓰므로 대용량
+        DB/로그도 즉시 스캔할 수 있다. 빈 파일은 mmap이 불가능하므로
+        (None, None)을 반환한다.
+        """
+        try:
+            f = open(actual_path, 'rb')
+        except OSError:
+            return None, None
+        try:
+            return f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, OSError):
+            f.close()
+            return None, None
+
     def read_file_for_search(self, file_path):
         """검색용 파일 읽기 (텍스트 파일만)"""
         try:
             if self.choice == "1":
-                with zipfile.ZipFile(self.zipfile, 'r') as zip_ref:
-                    if file_path not in zip_ref.namelist():
-                        return None
-                    with zip_ref.open(file_path) as file:
-                        try:
-                            content = file.read().decode('utf-8', errors='ignore')
-                            return content
-                        except:
-                            try:
-                                content = file.read().decode('cp949', errors='ignore')
-                                return content
-                            except:
-                                return None
+                if file_path not in self.file_set:  # namelist 선형 스캔 대신 캐시된 set 조회
+                    return None
+                # errors='ignore' 디코딩은 실패하지 않으므로 cp949 재시도는
+                # 죽은 코드였다 — 게다가 zip 핸들은 되감기지 않아 재시도가
+                # 빈 바이트를 디코딩하고 있었다. 한 번 읽고 한 번 디코딩.
+                with self._get_zipref().open(file_path) as file:
+                    return file.read().decode('utf-8', errors='ignore')
             elif self.choice == "3":
                 actual_path = self.get_actual_path(file_path) if isinstance(file_path, str) and not os.path.isabs(file_path) else file_path
                 if not actual_path or not os.path.exists(actual_path):
                     return None
                 try:
+                    # 큰 파일은 mmap으로 열어 커널 페이지 캐시에서 바로 디코딩
+                    # (버퍼드 read()의 중간 복사 제거). 작은 파일은 mmap 설정
+                    # 비용이 더 크므로 일반 read 사용.
+                    if os.path.getsize(actual_path) >= 65536:
+                        file_obj, mm_obj = self._open_mmap(actual_path)
+                        if mm_obj is not None:
+                            try:
+                                return mm_obj[:].decode('utf-8', errors='ignore')
+                            finally:
+                                mm_obj.close()
+                                file_obj.close()
                     with open(actual_path, 'r', encoding='utf-8', errors='ignore') as f:
                         return f.read()
-                except:
+                except OSError:
                     try:
                         with open(actual_path, 'r', encoding='cp949', errors='ignore') as f:
                             return f.read()
@@ -6161,19 +6896,61 @@ class ResetClassGUI:
             "/cache",
         ]
         
-        for base_path in search_paths:
-            try:
-                result = subprocess.run(self.get_adb_args('shell', 'su', '-c', f'find {base_path} -type f 2>/dev/null | head -1000'),
-                                      stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, timeout=30)
-                if result.returncode == 0:
-                    files = result.stdout.strip().split('\n')
-                    file_list.extend([f for f in files if f.strip()])
-            except:
-                continue
-        
+        # 경로마다 adb 세션 + su 포크를 반복하는 대신 find 한 번에 모두 전달
+        # (세션 5회 → 1회). 출력은 bytes로 받아 직접 디코딩해 로캘 경로 회피.
+        try:
+            result = subprocess.run(
+                self.get_adb_args('shell', 'su', '-c',
+                                  f'find {" ".join(search_paths)} -type f 2>/dev/null | head -5000'),
+                stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=60)
+            if result.returncode == 0:
+                output = result.stdout.decode('utf-8', errors='replace')
+                file_list = [f for f in output.strip().split('\n') if f.strip()]
+        except:
+            pass
+
         return file_list[:5000]  # 최대 5000개 파일로 제한
 
 
+class _ListTableModel(QAbstractTableModel):
+    """행 튜플 리스트를 그대로 노출하는 읽기 전용 테이블 모델
+
+    QTableWidget은 셀마다 QTableWidgetItem 객체를 만들지만, 이 모델은
+    행 리스트만 들고 있고 data()는 화면에 보이는 셀에 대해서만 호출되므로
+    수천 행도 즉시 표시된다. 정렬/필터는 QSortFilterProxyModel이 담당.
+    """
+
+    def __init__(self, headers, parent=None):
+        super().__init__(parent)
+        self._headers = headers
+        self._rows = []
+
+    def set_rows(self, rows):
+        """행 전체 교체 (리셋 한 번으로 뷰 갱신)"""
+        self.beginResetModel()
+        self._rows = rows
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and index.isValid():
+            try:
+                return self._rows[index.row()][index.column()]
+            except IndexError:
+                return None
+        return None
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self._headers[section]
+        return super().headerData(section, orientation, role)
+
+
 class SavedResultsExplorer(QDialog):
     """파일 탐색기 스타일의 저장된 결과 뷰어"""
     def __init__(self, parent):
@@ -6183,6 +6960,9 @@ class SavedResultsExplorer(QDialog):
         self.results_dir = os.path.join(os.path.dirname(__file__), "saved_results")
         self.current_data = None
         self.current_filepath = None  # 현재 선택된 파일 경로
+        self._json_cache = {}  # 경로 -> (mtime_ns, size, data): 변경 없는 파일 재파싱 방지
+        self._pending_data = None  # 현재 선택된 결과 (탭 지연 채움용)
+        self._tab_dirty = {}  # 탭 인덱스 -> 다시 채워야 하는지
         self.init_ui()
         self.load_results()
     
@@ -6292,29 +7072,34 @@ class SavedResultsExplorer(QDialog):
         
         detail_layout.addWidget(info_group)
         
-        # 상세 정보 탭
+        # 상세 정보 탭 (내용은 탭이 실제로 보일 때 채움)
         self.detail_tabs = QTabWidget()
+        self.detail_tabs.currentChanged.connect(self._populate_current_tab)
         detail_layout.addWidget(self.detail_tabs)
         
         # 아티팩트 결과 탭
         self.artifact_tabs = QTabWidget()
         self.detail_tabs.addTab(self.artifact_tabs, "아티팩트 결과")
         
-        # Summary results tab
-        self.summary_table = QTableWidget()
-        self.summary_table.setColumnCount(4)
-        self.summary_table.setHorizontalHeaderLabels(["Artifact", "Path", "Time", "Original Time"])
+        # Summary results tab (셀 위젯 없는 모델 기반 뷰: 행이 많아도 즉시 표시)
+        self.summary_model = _ListTableModel(["Artifact", "Path", "Time", "Original Time"])
+        summary_proxy = QSortFilterProxyModel(self)
+        summary_proxy.setSourceModel(self.summary_model)
+        self.summary_table = QTableView()
+        self.summary_table.setModel(summary_proxy)
         self.summary_table.horizontalHeader().setStretchLastSection(True)
-        self.summary_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.summary_table.setEditTriggers(QTableView.NoEditTriggers)
         self.summary_table.setSortingEnabled(True)
         self.detail_tabs.addTab(self.summary_table, "Summary Results")
-        
+
         # Deep search results tab
-        self.deep_search_table = QTableWidget()
-        self.deep_search_table.setColumnCount(4)
-        self.deep_search_table.setHorizontalHeaderLabels(["Search Time", "File Path", "Match Format", "Match Value"])
+        self.deep_search_model = _ListTableModel(["Search Time", "File Path", "Match Format", "Match Value"])
+        deep_proxy = QSortFilterProxyModel(self)
+        deep_proxy.setSourceModel(self.deep_search_model)
+        self.deep_search_table = QTableView()
+        self.deep_search_table.setModel(deep_proxy)
         self.deep_search_table.horizontalHeader().setStretchLastSection(True)
-        self.deep_search_table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.deep_search_table.setEditTriggers(QTableView.NoEditTriggers)
         self.detail_tabs.addTab(self.deep_search_table, "Deep Search Results")
         
         splitter.addWidget(detail_widget)
@@ -6341,42 +7126,19 @@ class SavedResultsExplorer(QDialog):
             
             filepath = os.path.join(self.results_dir, filename)
             try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                
-                # 사용자가 지정한 파일명 사용 (없으면 실제 파일명 사용)
-                saved_filename = data.get('saved_filename', filename)
-                display_name = saved_filename.replace('.json', '')
-                
-                # 파일명 파싱
-                parts = display_name.split()
-                order = '기타'
-                manufacturer = ''
-                model = ''
-                scenario = ''
-                
-                if len(parts) >= 1:
-                    # Check for order pattern: "N차" or "ExN" format
-                    if '차' in parts[0] or (parts[0].startswith('Ex') and len(parts[0]) > 2 and parts[0][2:].isdigit()):
-                        order = parts[0]
-                        remaining = parts[1:] if len(parts) > 1 else []
-                    else:
-                        remaining = parts
-                    
-                    if len(remaining) >= 3:
-                        manufacturer = remaining[0]
-                        model = remaining[1]
-                        scenario = ' '.join(remaining[2:])
-                    elif len(remaining) == 2:
-                        manufacturer = remaining[0]
-                        model = remaining[1]
-                    elif len(remaining) == 1:
-                        model = remaining[0]
+                # 트리 구성에는 파일명만 필요하므로 여기서는 JSON을 파싱하지
+                # 않는다 (본문은 선택 시 _load_result_file로 지연 로드).
+                # save_edited_info가 저장 시 파일명을 saved_filename으로
+                # 바꿔 두므로 디스크 파일명이 곧 표시/그룹화 키다.
+                display_name = filename[:-len('.json')]
+
+                # 파일명 파싱 (메모이즈된 공용 파서)
+                order, manufacturer, model, scenario = _parse_saved_filename(display_name)
+                order = order or '기타'
                 
                 file_list.append({
                     'filename': filename,
                     'filepath': filepath,
-                    'data': data,
                     'display_name': display_name,
                     'order': order,
                     'manufacturer': manufacturer,
@@ -6422,21 +7184,35 @@ class SavedResultsExplorer(QDialog):
                     result_item = QTreeWidgetItem(model_item)
                     result_item.setText(0, file_info['display_name'])
                     result_item.setData(0, Qt.UserRole, file_info['filepath'])
-                    result_item.setData(0, Qt.UserRole + 1, file_info['data'])
-    
+
+    def _load_result_file(self, filepath):
+        """결과 JSON 지연 로드 (mtime/size가 그대로면 파싱 결과 재사용)"""
+        st = os.stat(filepath)
+        stat_key = (st.st_mtime_ns, st.st_size)
+        cached = self._json_cache.get(filepath)
+        if cached is not None and cached[:2] == stat_key:
+            return cached[2]
+        data = self._attach_display_times(_json_load_file(filepath))
+        self._json_cache[filepath] = (st.st_mtime_ns, st.st_size, data)
+        return data
+
     def on_selection_changed(self):
         """선택 변경 시 상세 정보 표시"""
         selected = self.tree.selectedItems()
         if not selected:
             return
-        
+
         item = selected[0]
         filepath = item.data(0, Qt.UserRole)
-        data = item.data(0, Qt.UserRole + 1)
-        
-        if not filepath or not data:
+
+        if not filepath:
             return
-        
+
+        try:
+            data = self._load_result_file(filepath)
+        except Exception:
+            return
+
         self.current_data = data
         self.current_filepath = filepath  # 파일 경로 저장 (저장 시 필요)
         self.display_result(data)
@@ -6445,13 +7221,63 @@ class SavedResultsExplorer(QDialog):
         """더블 클릭 시 상세 정보 표시"""
         self.on_selection_changed()
     
+    @staticmethod
+    def _attach_display_times(data):
+        """아티팩트 항목에 파싱된 시간과 표시 문자열을 한 번만 부착
+
+        display_result가 선택이 바뀔 때마다 행별로 fromisoformat을 두 번
+        (탭 표시 + 요약 정렬) 호출하지 않도록, 로드 시 '_dt'(datetime)와
+        '_display_time'(표시용 문자열)을 계산해 둔다. 멱등이며, '_' 접두
+        키는 저장 시 제거되어 디스크 포맷은 그대로 유지된다.
+        """
+        for artifact_data_list in data.get('artifact_data', {}).values():
+            for data_item in artifact_data_list:
+                if not isinstance(data_item, dict) or '_display_time' in data_item:
+                    continue
+                dt = None
+                time_val = data_item.get('time')
+                if time_val:
+                    try:
+                        dt = _parse_iso(time_val)
+                        time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
+                        time_str += " KST" if data_item.get('is_kst') else " UTC"
+                    except Exception:
+                        time_str = str(time_val)
+                else:
+                    time_str = ""
+                data_item['_dt'] = dt
+                data_item['_display_time'] = _intern_str(time_str)
+                # 이름/경로도 행마다 같은 내용의 별도 str로 파싱되므로 공유
+                # (키가 없던 항목에 새 키를 만들지는 않는다 — 저장 포맷 보존)
+                for key in ('name', 'path'):
+                    val = data_item.get(key)
+                    if val is not None:
+                        data_item[key] = _intern_str(val)
+        return data
+
+    @staticmethod
+    def _strip_private_keys(data):
+        """'_' 접두 표시용 키를 제외한 저장용 사본 반환 (디스크 포맷 보존)"""
+        out = dict(data)
+        artifact_data = data.get('artifact_data')
+        if isinstance(artifact_data, dict):
+            out['artifact_data'] = {
+                aid: [{k: v for k, v in item.items() if not k.startswith('_')}
+                      if isinstance(item, dict) else item
+                      for item in items]
+                for aid, items in artifact_data.items()
+            }
+        return out
+
     def display_result(self, data):
         """결과 상세 정보 표시"""
+        # 캐시를 거치지 않고 들어온 데이터도 표시용 키를 갖도록 보강 (멱등)
+        self._attach_display_times(data)
         # 기본 정보 (모델명, 초기화 시간, 메모 포함)
         timestamp = data.get('timestamp', 'N/A')
         try:
             if timestamp != 'N/A':
-                dt = datetime.fromisoformat(timestamp)
+                dt = _parse_iso(timestamp)
                 timestamp = dt.strftime("%Y-%m-%d %H:%M:%S")
         except:
             pass
@@ -6470,8 +7296,7 @@ class SavedResultsExplorer(QDialog):
         if not order or not manufacturer or not scenario:
             if saved_filename:
                 parts = saved_filename.replace('.json', '').split()
-                # Check for order pattern: "N차" or "ExN" format
-                if len(parts) >= 1 and ('차' in parts[0] or (parts[0].startswith('Ex') and len(parts[0]) > 2 and parts[0][2:].isdigit())):
+                if parts and _ORDER_RE.search(parts[0]):
                     if not order:
                         order = parts[0]
                     if len(parts) >= 2 and not manufacturer:
@@ -6496,112 +7321,114 @@ class SavedResultsExplorer(QDialog):
 """
         self.info_text.setPlainText(info_text)
         
-        # 아티팩트 결과
+        # 테이블 채움은 탭이 실제로 보일 때로 미룸: 선택이 바뀔 때마다
+        # 세 탭(아티팩트/요약/딥서치)을 전부 다시 만드는 대신 모두
+        # dirty로 표시해 두고 현재 탭만 채운다.
+        self._pending_data = data
+        self._tab_dirty = {i: True for i in range(self.detail_tabs.count())}
+        self.artifact_tabs.clear()
+        self.summary_model.set_rows([])
+        self.deep_search_model.set_rows([])
+        self._populate_current_tab()
+
+    _ARTIFACT_NAMES = {
+        "1": "bootstat",
+        "2-1": "recovery.log",
+        "2-2": "last_log",
+        "3": "suggestions.xml",
+        "4": "persistent_properties",
+        "5": "appops",
+        "6": "wellbing",
+        "7": "internal",
+        "8": "eRR.p",
+        "9": "ULR_PERSISTENT_PREFS.xml"
+    }
+
+    def _populate_current_tab(self, _index=None):
+        """현재 보이는 상세 탭만 채우기 (dirty 탭 한정)"""
+        data = self._pending_data
+        if data is None:
+            return
+        idx = self.detail_tabs.currentIndex()
+        if not self._tab_dirty.get(idx):
+            return
+        self._tab_dirty[idx] = False
+
+        widget = self.detail_tabs.widget(idx)
+        widget.setUpdatesEnabled(False)
+        try:
+            if widget is self.artifact_tabs:
+                self._populate_artifact_tabs(data)
+            elif widget is self.summary_table:
+                self._populate_summary_table(data)
+            elif widget is self.deep_search_table:
+                self._populate_deep_search_table(data)
+        finally:
+            widget.setUpdatesEnabled(True)
+
+    def _populate_artifact_tabs(self, data):
+        """아티팩트별 결과 테이블 구성"""
         self.artifact_tabs.clear()
-        artifact_names = {
-            "1": "bootstat",
-            "2-1": "recovery.log",
-            "2-2": "last_log",
-            "3": "suggestions.xml",
-            "4": "persistent_properties",
-            "5": "appops",
-            "6": "wellbing",
-            "7": "internal",
-            "8": "eRR.p",
-            "9": "ULR_PERSISTENT_PREFS.xml"
-        }
-        
         for artifact_id, artifact_data_list in data.get('artifact_data', {}).items():
             if not artifact_data_list:
                 continue
-            
+
             table = QTableWidget()
             table.setColumnCount(5)
             table.setHorizontalHeaderLabels(["아티팩트", "경로", "시간", "원본 시간", "메시지"])
             table.horizontalHeader().setStretchLastSection(True)
             table.setEditTriggers(QTableWidget.NoEditTriggers)
             table.setAlternatingRowColors(True)
-            
-            for data_item in artifact_data_list:
-                row = table.rowCount()
-                table.insertRow(row)
-                
+
+            # 행 단위 insertRow는 매번 지오메트리를 재계산하므로 한 번에 확보
+            table.setRowCount(len(artifact_data_list))
+            for row, data_item in enumerate(artifact_data_list):
                 table.setItem(row, 0, QTableWidgetItem(data_item.get('name', '')))
                 table.setItem(row, 1, QTableWidgetItem(data_item.get('path', '')))
-                
-                # 시간 표시
-                if data_item.get('time'):
-                    try:
-                        dt = datetime.fromisoformat(data_item['time'])
-                        time_str = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        if data_item.get('is_kst'):
-                            time_str += " KST"
-                        else:
-                            time_str += " UTC"
-                    except:
-                        time_str = str(data_item.get('time', ''))
-                else:
-                    time_str = ""
-                
-                table.setItem(row, 2, QTableWidgetItem(time_str))
+
+                # 시간 표시 (로드 시 계산해 둔 문자열 재사용)
+                table.setItem(row, 2, QTableWidgetItem(data_item.get('_display_time', '')))
                 table.setItem(row, 3, QTableWidgetItem(data_item.get('original_time', '')))
                 table.setItem(row, 4, QTableWidgetItem(data_item.get('message', '')))
-            
-            table.resizeColumnsToContents()
-            artifact_name = artifact_names.get(artifact_id, f"아티팩트 {artifact_id}")
+
+            _size_columns_from_sample(table)
+            artifact_name = self._ARTIFACT_NAMES.get(artifact_id, f"아티팩트 {artifact_id}")
             self.artifact_tabs.addTab(table, artifact_name)
-        
-        # Summary results
-        self.summary_table.setRowCount(0)
+
+    def _populate_summary_table(self, data):
+        """시간순 요약 테이블 구성"""
         all_times = []
         for artifact_id, artifact_data_list in data.get('artifact_data', {}).items():
             for data_item in artifact_data_list:
-                if data_item.get('time'):
-                    try:
-                        dt = datetime.fromisoformat(data_item['time'])
-                        all_times.append({
-                            'time': dt,
-                            'artifact_id': artifact_id,
-                            'data': data_item
-                        })
-                    except:
-                        pass
-        
-        all_times.sort(key=lambda x: x['time'])
-        
-        for item in all_times:
-            row = self.summary_table.rowCount()
-            self.summary_table.insertRow(row)
-            
-            artifact_name = artifact_names.get(item['artifact_id'], f"Artifact {item['artifact_id']}")
-            data_item = item['data']
-            
-            self.summary_table.setItem(row, 0, QTableWidgetItem(artifact_name))
-            self.summary_table.setItem(row, 1, QTableWidgetItem(data_item.get('path', '')))
-            
-            time_str = item['time'].strftime("%Y-%m-%d %H:%M:%S")
-            if data_item.get('is_kst'):
-                time_str += " KST"
-            else:
-                time_str += " UTC"
-            
-            self.summary_table.setItem(row, 2, QTableWidgetItem(time_str))
-            self.summary_table.setItem(row, 3, QTableWidgetItem(data_item.get('original_time', '')))
-        
-        self.summary_table.resizeColumnsToContents()
-        
-        # Deep search results
-        self.deep_search_table.setRowCount(0)
-        for result in data.get('deep_search_results', []):
-            row = self.deep_search_table.rowCount()
-            self.deep_search_table.insertRow(row)
-            self.deep_search_table.setItem(row, 0, QTableWidgetItem(result.get('search_time', '')))
-            self.deep_search_table.setItem(row, 1, QTableWidgetItem(result.get('file_path', '')))
-            self.deep_search_table.setItem(row, 2, QTableWidgetItem(result.get('match_format', '')))
-            self.deep_search_table.setItem(row, 3, QTableWidgetItem(result.get('match_value', '')))
-        
-        self.deep_search_table.resizeColumnsToContents()
-    
+                dt = data_item.get('_dt')
+                if dt is not None:
+                    all_times.append((dt, artifact_id, data_item))
+
+        all_times.sort(key=lambda x: x[0])
+
+        names = self._ARTIFACT_NAMES
+        rows = [
+            (names.get(artifact_id, f"Artifact {artifact_id}"),
+             data_item.get('path', ''),
+             data_item.get('_display_time', ''),
+             data_item.get('original_time', ''))
+            for _, artifact_id, data_item in all_times
+        ]
+        self.summary_model.set_rows(rows)
+        _size_columns_from_sample(self.summary_table)
+
+    def _populate_deep_search_table(self, data):
+        """딥서치 결과 테이블 구성"""
+        rows = [
+            (_intern_str(result.get('search_time', '')),
+             _intern_str(result.get('file_path', '')),
+             _intern_str(result.get('match_format', '')),
+             result.get('match_value', ''))
+            for result in data.get('deep_search_results', [])
+        ]
+        self.deep_search_model.set_rows(rows)
+        _size_columns_from_sample(self.deep_search_table)
+
     def save_edited_info(self):
         """편집된 상세 정보 저장"""
         try:
@@ -6645,18 +7472,18 @@ class SavedResultsExplorer(QDialog):
                     try:
                         if os.path.exists(self.current_filepath):
                             os.rename(self.current_filepath, new_filepath)
+                        self._json_cache.pop(self.current_filepath, None)  # 옛 경로 캐시 무효화
                         self.current_filepath = new_filepath
                     except Exception as e:
                         self.show_message("경고", f"파일명 변경 실패: {str(e)}\n데이터는 저장되었습니다.")
                 
                 self.current_data['saved_filename'] = new_filename
             
-            # JSON 직렬화 가능한 형태로 변환
-            serializable_data = self._convert_to_json_serializable(self.current_data)
-            
-            # 파일 저장
-            with open(self.current_filepath, 'w', encoding='utf-8') as f:
-                json.dump(serializable_data, f, ensure_ascii=False, indent=2)
+            # 파일 저장 (표시용 '_' 키 제거, datetime 변환은 표준 json 폴백에서만)
+            _json_dump_file(self.current_filepath,
+                            self._strip_private_keys(self.current_data),
+                            self._convert_to_json_serializable)
+            self._json_cache.pop(self.current_filepath, None)  # 다음 로드 때 새 내용 파싱
             
             # 성공 메시지
             self.show_message("성공", "상세 정보가 저장되었습니다.")
@@ -6669,19 +7496,9 @@ class SavedResultsExplorer(QDialog):
             error_msg = f"저장 중 오류가 발생했습니다: {str(e)}\n{traceback.format_exc()}"
             self.show_message("오류", error_msg)
     
-    def _convert_to_json_serializable(self, obj):
-        """datetime 객체를 JSON 직렬화 가능한 형태로 변환"""
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        elif isinstance(obj, dict):
-            return {key: self._convert_to_json_serializable(value) for key, value in obj.items()}
-        elif isinstance(obj, (list, tuple)):
-            return [self._convert_to_json_serializable(item) for item in obj]
-        elif isinstance(obj, (int, float, str, bool, type(None))):
-            return obj
-        else:
-            return str(obj)
-    
+    # FactoryResetGUI의 구현과 동일한 반복(스택) 버전 재사용
+    _convert_to_json_serializable = FactoryResetGUI._convert_to_json_serializable
+
     def show_message(self, title, message):
         """메시지 표시"""
         msg = QMessageBox(self)
@@ -6714,6 +7531,7 @@ class SavedResultsExplorer(QDialog):
         if reply == QMessageBox.Yes:
             try:
                 os.remove(filepath)
+                self._json_cache.pop(filepath, None)
                 self.load_results()  # 목록 새로고침
                 self.show_message("완료", "삭제되었습니다.")
             except Exception as e: